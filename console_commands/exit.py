@@ -13,6 +13,9 @@ instructions = """
         "exit --help"  ... get usage instructions
 """
 
+# Parameters that show the usage instructions
+_HELP_FLAGS = frozenset(('-h', '--help', '?', 'help'))
+
 def initialize(register, module_name):
     '''Console Command registers itself at Console'''
     # Mandatory line
@@ -22,12 +25,11 @@ def cons_cmd_exit(game_ctx, params):
     ''' Exit Console Command implementation
     '''
 
-    # Save all parameters passed from the Console in the list
-    all_params = params.split()
-    no_of_params = len(all_params) - 1 # exclude the script name
+    # Only the last parameter is needed - split it off the end of the string
+    last_param = params.rsplit(None, 1)[-1]
 
     # Show instructions if the last parametr indicates so
-    if all_params[-1] in ('-h','--help', '?', 'help'):
+    if last_param in _HELP_FLAGS:
         print(instructions)
 
     # Print all the parameters on the console
@@ -8,6 +8,8 @@
 
 '''
 
+import functools
+
 instructions = """
     Examples of usage:
         "move"         ... get usage instructions
@@ -16,6 +18,17 @@ instructions = """
         "move 200 300" ... move to the new position
 """
 
+# Parameters that show the usage instructions
+_HELP_FLAGS = frozenset(('-h', '--help', '?', 'help'))
+
+@functools.lru_cache(maxsize=128)
+def _split_params(params):
+    '''Splits the command line and checks if the last parameter asks for help - repeated commands
+    (e.g. recalled from history) are taken from the cache'''
+    parts = params.split(None, 3)
+    # Only the unsplit rest of the line can hold more than one parameter
+    return tuple(parts), parts[-1].rsplit(None, 1)[-1] in _HELP_FLAGS
+
 def initialize(register, module_name):
     '''Console Command registers itself at Console'''
     # Mandatory line
@@ -25,12 +38,11 @@ def cons_cmd_move(game_ctx, params):
     ''' Move Console Command implementation
     '''
 
-    # Save all parameters passed from the Console in the list
-    all_params = params.split()
-    no_of_params = len(all_params) - 1 # exclude the script name
+    # Only the command name and the two coordinates are needed - stop splitting after them
+    all_params, show_help = _split_params(params)
 
     # Show instructions if the last parametr indicates so
-    if all_params[-1] in ('-h','--help', '?', 'help'):
+    if show_help:
         print(instructions)
 
     # Print all the parameters on the console
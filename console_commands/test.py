@@ -5,16 +5,28 @@
         "test -h"      ... get usage instructions
         "test --help"  ... get usage instructions
         "test 1 2 p=x" ... write any input parameters to the console
+        "test 1 2 --verbose" ... write also details of the game handler
 '''
 
+import functools
+
 instructions = """
     Examples of usage:
         "test"         ... get usage instructions
         "test -h"      ... get usage instructions
         "test --help"  ... get usage instructions
         "test 1 2 p=x" ... write any input parameters to the console
+        "test 1 2 --verbose" ... write also details of the game handler
 """
 
+# Parameters that show the usage instructions
+_HELP_FLAGS = frozenset(('-h', '--help', '?', 'help'))
+
+@functools.lru_cache(maxsize=128)
+def _split_params(params):
+    '''Splits the command line - repeated commands (e.g. recalled from history) are taken from the cache'''
+    return tuple(params.split())
+
 def initialize(register, module_name):
     '''Console Command registers itself at Console'''
     # Mandatory line
@@ -27,15 +39,15 @@ def cons_cmd_test(game_ctx, params):
     '''
 
     # Save all parameters passed from the Console in the list
-    all_params = params.split()
+    all_params = _split_params(params)
     no_of_params = len(all_params) - 1 # exclude the script name
 
     # Show instructions if the last parametr indicates so
-    if all_params[-1] in ('-h','--help', '?', 'help') or no_of_params < 1:
+    if all_params[-1] in _HELP_FLAGS or no_of_params < 1:
         print(instructions)
 
     # Print all the parameters on the console
     else:
-        print(f'Parameters: {all_params}')
-        print(f'Game handler details: {game_ctx.__dir__()}')
+        print(f'Parameters: {list(all_params)}')
+        if '--verbose' in all_params: print(f'Game handler details: {game_ctx.__dir__()}')
         return 0
@@ -4,11 +4,44 @@
 '''
 
 import pygame
+import functools
+import json
+import os
+import re
+import sys
+import time
 
 from  pygame_console import Console
-from random import randint
+from random import choices
 from datetime import datetime
 
+# Frame rate of the game loop - events are pumped once per frame
+FPS = 30
+
+# Sample console configurations, selected by their number 1 to 6
+CONSOLE_CONFIGS = tuple(f'console_configs/console_config0{sample}.json' for sample in range(1, 7))
+
+# Possible random steps of the square on each axis and how many of them are drawn at once
+STEPS = (-2, -1, 0, 1, 2)
+STEPS_BUFFER_SIZE = 4096
+
+# Json string (group 1, kept) or C-style line comment (removed) in json config files.
+# Strings are matched first so that '//' inside of them is not taken for a comment.
+_JSON_COMMENT_RE = re.compile(r'("(?:\\.|[^"\\])*")|//.*')
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config(config_file_path: str, mtime: float):
+    ''' Reads and parses the json console config. Result is cached per path and
+    file modification time, so repeated calls skip the file I/O and parsing
+    until the file changes. The returned dict is shared between callers and
+    should not be modified.
+    '''
+    with open(config_file_path, 'r') as json_file:
+        json_data = json_file.read()
+        return json.loads(_JSON_COMMENT_RE.sub(lambda m: m.group(1) or '', json_data)) # Remove C-style comments before processing JSON
+
+
 class TestObject:
     ''' Testing object that will be govern by console.
     Print moving square on the screen with the console
@@ -20,15 +53,33 @@ class TestObject:
         self.screen = pygame.display.set_mode((800, 600))
         self.clock = pygame.time.Clock()
 
+        # Queue only the events used by the game and the console, so the event
+        # loop does not iterate mouse motion etc. every frame. Expose events are
+        # needed to redraw the whole window after it was covered.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT, pygame.MOUSEBUTTONDOWN,
+                                  pygame.MOUSEWHEEL, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE])
+
         self.pos = [0,0]
         self.exit = False
-        self.surf = pygame.Surface((50, 50))
+        self._full_redraw = False # whole screen must be pushed to the display, e.g. after the window was exposed
+        self._time_cache = (0, '') # last whole second and its text shown by cons_get_time
+        self.surf = pygame.Surface((50, 50)).convert() # match the screen pixel format for fast blits
+
+        # Handlers of the events the game reacts to
+        self._event_handlers = {
+            pygame.QUIT : self._on_quit,
+            pygame.KEYDOWN : self._on_keydown,
+            pygame.KEYUP : self._on_keyup,
+            pygame.WINDOWEXPOSED : self._on_expose,
+            pygame.VIDEOEXPOSE : self._on_expose
+        }
         self.surf.fill((255,255,255))
 
         ''' Console integration code - START
             ********************************
         '''
-        # Generate random console config (no parameter) or specify the layout by nums 1 to 6
+        # Read the console config from the json file
         console_config = self.get_console_config_json(console_config_file)
 
         # Create console based on the config - feel free to implement custom code to read the config directly from json
@@ -39,48 +90,117 @@ class TestObject:
         '''
 
     def update(self):
+
+        # Bind the attributes and constants used every frame to locals. Note that
+        # self.pos and self.surf are not bound - they can be replaced from the console.
+        screen_fill = self.screen.fill
+        screen_blit = self.screen.blit
+        event_get = pygame.event.get
+        event_wait = pygame.event.wait
+        NOEVENT = pygame.NOEVENT
+        display_update = pygame.display.update
+        display_flip = pygame.display.flip
+        get_ticks = pygame.time.get_ticks
+        clock_tick = self.clock.tick
+        console = self.console
+        console_update = console.update
+        console_show = console.show
+        rand_steps = choices
+        event_handler = self._event_handlers.get
+
+        # Random steps of the square are drawn in bulk and consumed two per frame
+        steps = rand_steps(STEPS, k=STEPS_BUFFER_SIZE)
+        steps_idx = 0
+
+        # Parts of the screen changed in the previous frame - whole screen before the first one
+        prev_rects = [self.screen.get_rect()]
+
+        # Event that woke up the idle game - handled before the events queued after it
+        waited_events = []
+
         while not self.exit:
-            
-            # Reset the screen
-            self.screen.fill((125, 125, 0))
 
-            # Move the square randomly
-            self.pos[0] += randint(-2,2) 
-            self.pos[1] += randint(-2,2)
+            # Reset the screen - only the parts drawn over in the previous frame need it
+            for rect in prev_rects: screen_fill((125, 125, 0), rect)
+
+            # Move the square randomly - keep it within <100, 500> on both axes
+            if steps_idx == STEPS_BUFFER_SIZE:
+                steps = rand_steps(STEPS, k=STEPS_BUFFER_SIZE)
+                steps_idx = 0
+            pos = self.pos
+            pos[0] = min(500, max(100, pos[0] + steps[steps_idx]))
+            pos[1] = min(500, max(100, pos[1] + steps[steps_idx + 1]))
+            steps_idx += 2
 
             # Test of puting something to the console
             #self.console.write('position X: ' + str(self.pos[0]))
-
-            if self.pos[0] > 500: self.pos[0] = 500
-            if self.pos[0] < 100: self.pos[0] = 100
-            if self.pos[1] > 500: self.pos[1] = 500
-            if self.pos[1] < 100: self.pos[1] = 100
             
             # Process the keys
-            events = pygame.event.get()
+            events = event_get()
+            if waited_events:
+                events = waited_events + events
+                waited_events = []
             for event in events:
-                
-                # Exit on closing of the window
-                if event.type == pygame.QUIT: self.exit = True
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE: self.exit = True
-                elif event.type == pygame.KEYUP:						
-                    # Toggle console on/off the console							
-                    if event.key == pygame.K_F1: 						
-                        # Toggle the console - if on then off if off then on
-                        self.console.toggle()
+                handler = event_handler(event.type)
+                if handler: handler(event)
 
             # Update the game situation - blit square on screen and position
-            self.screen.blit(self.surf, (int(self.pos[0]), int(self.pos[1])))
+            square_rect = screen_blit(self.surf, (int(pos[0]), int(pos[1])))
+
+            # Skip the console completely if it is hidden and not being animated
+            if console.is_active:
+
+                # Time of the frame - read once and shared by the console update and show
+                now = get_ticks()
+
+                # Read and process events related to the console in case console is enabled
+                console_update(events, now)	
+
+                # Display the console if enabled or animation is still in progress
+                console_show(self.screen, now=now)
+
+            # Push only the changed parts of the screen to the display - areas covered by the
+            # square and the console in this frame and in the previous one
+            dirty_rects = [square_rect, console.rect] if console.rect else [square_rect]
+            if self._full_redraw:
+                # The window content was lost - push the whole screen
+                self._full_redraw = False
+                display_flip()
+            else:
+                display_update(prev_rects + dirty_rects)
+
+            # Nothing is going on if the console is hidden and the square has not moved
+            idle = not console.is_active and square_rect == prev_rects[0]
+            prev_rects = dirty_rects
+
+            # If idle, wait in the event queue instead of looping. The received event is kept
+            # for the next frame, in front of the events queued after it.
+            if idle:
+                event = event_wait(1000 // FPS)
+                if event.type != NOEVENT: waited_events = [event]
 
-            # Read and process events related to the console in case console is enabled
-            self.console.update(events)	
+            # Sleep for the rest of the frame - caps the event pumping to FPS times per second
+            clock_tick(FPS)
 
-            # Display the console if enabled or animation is still in progress
-            self.console.show(self.screen)
+    def _on_quit(self, event):
+        ''' Exit on closing of the window
+        '''
+        self.exit = True
+
+    def _on_expose(self, event):
+        ''' Redraw the whole window after it was exposed
+        '''
+        self._full_redraw = True
+
+    def _on_keydown(self, event):
+        ''' Exit on Esc key
+        '''
+        if event.key == pygame.K_ESCAPE: self.exit = True
 
-            pygame.display.update()
-            self.clock.tick(30)
+    def _on_keyup(self, event):
+        ''' Toggle the console on F1 key - if on then off if off then on
+        '''
+        if event.key == pygame.K_F1: self.console.toggle()
 
     def move(self, move_x, move_y):
         ''' first argumet is movement on x-axis
@@ -94,13 +214,17 @@ class TestObject:
         ''' Example of function that can be passed to console to show dynamic
         data in the console
         '''
-        return str(self.pos)
+        return f'[{self.pos[0]}, {self.pos[1]}]'
     
     def cons_get_time(self):
         ''' Example of function that can be passed to console to show dynamic
-        data in the console
+        data in the console. The text changes only once per second,
+        so it is formatted again only when the second changes.
         '''
-        return str(datetime.now())
+        now = int(time.time())
+        if self._time_cache[0] != now:
+            self._time_cache = (now, str(datetime.fromtimestamp(now)))
+        return self._time_cache[1]
 
     def cons_get_details(self):
         ''' Example of function that can be passed to console to show dynamic
@@ -116,25 +240,18 @@ class TestObject:
 
     def get_console_config_json(self, config_file_path: str):
         
-        import json, re
-
         try:
-            with open(config_file_path, 'r') as json_file:
-                json_data = json_file.read()
-                return json.loads(re.sub("[^:]//.*","", json_data, flags=re.MULTILINE)) # Remove C-style comments before processing JSON
+            return _load_config(config_file_path, os.path.getmtime(config_file_path))
         except FileNotFoundError:
             raise
 
 
 if __name__ == '__main__':
     
-    # Initiate testing 'game' - select suitable configuration
-    t = TestObject(console_config_file="console_configs/console_config01.json")
-    #t = TestObject(console_config_file="console_configs/console_config02.json")
-    #t = TestObject(console_config_file="console_configs/console_config03.json")
-    #t = TestObject(console_config_file="console_configs/console_config04.json")
-    #t = TestObject(console_config_file="console_configs/console_config05.json")
-    #t = TestObject(console_config_file="console_configs/console_config06.json")
+    # Initiate testing 'game' - select suitable configuration by its number 1 to 6 passed
+    # as the command line argument (default is 1). Only the selected config file is loaded.
+    sample = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    t = TestObject(console_config_file=CONSOLE_CONFIGS[sample - 1])
 
     # Enter the infinite loop - press Esc to exit or type 'exit' into the console
     t.update()
\ No newline at end of file
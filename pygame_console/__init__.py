@@ -44,9 +44,11 @@
 		-	show_amim_console for animated spawn in main game class
 '''
 
-from io import StringIO # for redirection of commands output to the graphical console
 from pathlib import Path
+from collections import deque # for the bounded output and input history buffers
+from itertools import islice # for the displayed part of the output buffer
 import sys	# for redirection of stdout to the graphical console
+import re # for substitution of script parameters
 import pygame # for Surface and graphics init
 import pygame.freetype # for all the fonts
 import pygame.locals as pl # for key names
@@ -54,9 +56,11 @@ import cmd	# for command line support https://docs.python.org/3/library/cmd.html
 
 # Utils functions
 from importlib import import_module
+import functools
 
+@functools.lru_cache(maxsize=None)
 def str_to_package_module(package: str, module: str):
-    '''Gets reference to the module in the package
+    '''Gets reference to the module in the package. Found modules are cached.
 
     Parameters:
         :param package: Path to the package, for example pyrpg.core.ecs
@@ -65,13 +69,89 @@ def str_to_package_module(package: str, module: str):
         :param module: Path to the module, relative to the package
         :type module: str
     '''
+    # Already imported modules do not need to go through the import machinery
+    if not module.startswith('.'):
+        imported_module = sys.modules.get(module)
+        if imported_module is not None: return imported_module
+
     try:
         return import_module(module, package=package)
     except ModuleNotFoundError:
         raise ValueError(f'Incorrect package.module name "{package}.{module}"')
 
+@functools.lru_cache(maxsize=256)
+def _render_text_cached(font_object, text: str, color: tuple):
+    return font_object.render(text, color, None)
+
+def render_text(font_object, text: str, color):
+    '''Renders the text by the font and returns (surface, rect) pair same as font_object.render.
+    Recently rendered texts are taken from the cache, so the returned surface and rect
+    are shared and must not be modified.
+
+    Parameters:
+        :param font_object: Font used for rendering
+        :type font_object: pygame.freetype.Font
+
+        :param text: Text to be rendered
+        :type text: str
+
+        :param color: Color of the text
+        :type color: tuple or list
+    '''
+    return _render_text_cached(font_object, text, tuple(color))
+
+def _convert_surface(surface, alpha: bool=False):
+    '''Returns copy of the surface in the pixel format of the display, so that it is
+    not converted again on every blit. If the display mode is not set yet,
+    the surface is returned unchanged.
+
+    Parameters:
+        :param surface: Surface to be converted
+        :type surface: pygame.Surface
+
+        :param alpha: If True, per pixel alpha of the surface is kept
+        :type alpha: bool
+    '''
+    try:
+        return surface.convert_alpha() if alpha else surface.convert()
+    except pygame.error:
+        return surface
+
+@functools.lru_cache(maxsize=None)
+def _load_font(font_file: str, font_size):
+    return pygame.freetype.Font(font_file, font_size)
+
+def _get_font(font_file: str, font_size):
+    '''Returns the font of the given file and size. Fonts are cached, so that components
+    using the same font share one Font object together with its glyph cache.
+    The freetype module is initialized on the first call (and after it was quit,
+    in which case the cached fonts are not usable anymore and are dropped).
+
+    Parameters:
+        :param font_file: Path to the font file
+        :type font_file: str
+
+        :param font_size: Font size
+        :type font_size: int
+    '''
+    if not pygame.freetype.get_init():
+        pygame.freetype.init()
+        _load_font.cache_clear()
+    return _load_font(font_file, font_size)
+
+@functools.lru_cache(maxsize=256)
+def _compile_shell(params: str):
+    '''Compiles the python command entered into the console shell. Compiled
+    commands are cached, so repeated commands are not parsed again.
 
-class Padding(tuple):
+    Parameters:
+        :param params: Python expression or assignment entered after '!'
+        :type params: str
+    '''
+    return compile('Result = ' + params, '<string>', 'exec')
+
+
+class Padding:
 	''' Class to facilitate easier and more understandable work 
 	with console paddings that are tuples (indexing). Items of this class
 	can be accessed by either indexing or by name.
@@ -82,16 +162,58 @@ class Padding(tuple):
 		pad.up returns also 1
 	'''
 
+	# Paddings are read on every frame - slots make the attribute access cheaper than instance dict
+	__slots__ = ('up', 'down', 'left', 'right')
+
 	def __init__(self, padding=(0,0,0,0)):
 		''' Init the padding and translate the tupple into 
 		readable padding properties.
 		'''
 
 		# Missing values during initiation are substituted by 0
-		self.up = padding[0] if len(padding) > 0 else 0
-		self.down = padding[1] if len(padding) > 1 else 0
-		self.left = padding[2] if len(padding) > 2 else 0
-		self.right = padding[3] if len(padding) > 3 else 0
+		self.up, self.down, self.left, self.right = (tuple(padding) + (0,0,0,0))[:4]
+
+	def __getitem__(self, index):
+		''' Access the padding by index in the order UP, DOWN, LEFT, RIGHT
+		'''
+		return (self.up, self.down, self.left, self.right)[index]
+
+	# The padding behaves as the tuple of its current values - it can be printed, compared, unpacked etc.
+	def __iter__(self):
+		return iter((self.up, self.down, self.left, self.right))
+
+	def __len__(self):
+		return 4
+
+	def __eq__(self, other):
+		return tuple(self) == (tuple(other) if isinstance(other, Padding) else other)
+
+	def __repr__(self):
+		return repr(tuple(self))
+
+class _ListIO:
+	''' Minimal file-like object collecting everything written to it. Used instead of
+	StringIO for capturing output of the commands - many small writes are just
+	appended to the list and joined only once by getvalue.
+	'''
+
+	__slots__ = ('parts',)
+
+	def __init__(self):
+		self.parts = []
+
+	def write(self, text):
+		self.parts.append(text)
+		return len(text)
+
+	def writelines(self, lines):
+		self.parts.extend(lines)
+
+	def flush(self):
+		pass
+
+	def getvalue(self):
+		return ''.join(self.parts)
 
 class CommandLineProcessor(cmd.Cmd):
 	''' Class implementing the logic behind console commands.
@@ -113,6 +235,10 @@ class CommandLineProcessor(cmd.Cmd):
 		self.cmd_pckg_path = cmd_pckg_path # the package containing modules implementing console commands
 		self.script_path = script_path # the path to the directory with console scripts
 		self._cmd_scripts = dict() # dict with functions implementing commands
+		self._capture_buf = _ListIO() # reused for capturing output of every command
+
+		# Built-in do_xxx commands by their name - used for running script lines without Cmd parsing
+		self._dispatch = {name[3:]: getattr(self, name) for name in self.get_names() if name.startswith('do_')}
 
 	def get_command(self, command_name: str):    
 		'''Gets the py script module from the storage if registered or register it first.
@@ -147,6 +273,34 @@ class CommandLineProcessor(cmd.Cmd):
 		'''
 		self._cmd_scripts.update({alias: fnc})
 
+	def _capture_stdout(self):
+		''' Redirects sys.stdout to the cleared capture buffer and returns the buffer.
+		If the buffer is already capturing (command called from another command),
+		new buffer is used so that the output of the outer command is not lost.
+		'''
+		buf = self._capture_buf if sys.stdout is not self._capture_buf else _ListIO()
+		buf.parts.clear()
+		sys.stdout = buf
+		return buf
+
+	def _fast_onecmd(self, line: str):
+		''' Faster variant of onecmd used for running the script lines. Built-in commands
+		are called directly from the dispatch dictionary and other commands are passed to 
+		default, same as onecmd does. Lines that are not a simple command name followed by
+		parameters (e.g. help shortcut '?') are left to onecmd.
+		'''
+		if not line: return self.emptyline()
+		if line[0] == '!': return self.do_shell(line[1:].strip())
+
+		command, _, params = line.partition(' ')
+		fnc = self._dispatch.get(command)
+		if fnc is not None: return fnc(params.strip())
+
+		# Command name must consist of identchars only, same as in onecmd
+		if not command.strip(self.identchars): return self.default(line)
+
+		return self.onecmd(line)
+
 	def emptyline(self):
 		''' In case empty line is entered, nothing happens
 		'''
@@ -184,7 +338,8 @@ class CommandLineProcessor(cmd.Cmd):
 		 - !game.console.padding = (20,20,20,20) ... changes padding on the console
 		'''
 		
-		console_out = sys.stdout = StringIO()
+		stdout_bckp = sys.stdout
+		console_out = self._capture_stdout()
 
 		globals_param = {'__buildins__' : None}
 		
@@ -195,7 +350,7 @@ class CommandLineProcessor(cmd.Cmd):
 		Result = None
 
 		try:
-			exec('Result = ' + params, globals_param, locals_param)
+			exec(_compile_shell(params), globals_param, locals_param)
 			Result = locals_param.get('Result')
 		except Exception as E:
 			self.output.write(str(E))
@@ -203,7 +358,7 @@ class CommandLineProcessor(cmd.Cmd):
 		finally:
 			self.output.write(str(console_out.getvalue()))
 			if Result: self.output.write(str(Result))
-			sys.stdout = sys.__stdout__
+			sys.stdout = stdout_bckp
 
 	def do_py_script(self, params):
 		''' Executes python script
@@ -212,7 +367,8 @@ class CommandLineProcessor(cmd.Cmd):
 				py_script test_script.py AmmoPack
 		'''
 		# Prepare the text output buffer
-		console_out = sys.stdout = StringIO()
+		stdout_bckp = sys.stdout
+		console_out = self._capture_stdout()
 
 		try:
 			py_script = self.get_command(params.split()[0]) # try to get the py script name
@@ -223,7 +379,7 @@ class CommandLineProcessor(cmd.Cmd):
 			self.output.write(str(E))
 			return -1
 		finally:
-			sys.stdout = sys.__stdout__ # restore the output buffer to original system output
+			sys.stdout = stdout_bckp # restore the output buffer to original output
 
 
 	def do_script(self, params):
@@ -272,33 +428,33 @@ class CommandLineProcessor(cmd.Cmd):
 			param_key, param_value = param.split('=')
 			params_dict[param_key] = param_value
 
+		# Pattern matching any $key from the params_dict - longer keys first so that $xy is not matched as $x
+		params_pattern = re.compile(r'\$(' + '|'.join(map(re.escape, sorted(params_dict, key=len, reverse=True))) + ')') if params_dict else None
+
 		# Debugs
 		#(f'{all_params=}\n{no_of_params=}\n{script_name=}\n{script_params=}\n{verbose_mode=}\n{script_path=}\n{params_list=}\n{params_dict=}')
 
 		try:
-			# Open script file
+			# Read the whole script file at once
 			with open(script_path) as f:
-				# For each line execute self.onecmd(line)
-				if verbose_mode: self.output.write('>S>Script ' + script_path + ' started.')
-
-				script_line = f.readline()
-				script_line_no = 1
-
-				while script_line:
-					
-					# Substitute the parameters in the particular command in the script (look for the $key in the params_dict)
-					# and substitute it with the value.
-					cmd_line = script_line.strip()
-					
-					# Replace all the keys found in the params_dict
-					for param_key, param_value in params_dict.items():
-						cmd_line = cmd_line.replace(f'${param_key}', param_value)
-
-					# Execute the command, now when all parameters are substituted with their values
-					#print(f'About to execute following cmd: {cmd_line=}')
-					error = self.onecmd(cmd_line)
-					if error: raise
-					else: script_line = f.readline()
+				script_lines = f.read().splitlines()
+
+			if verbose_mode: self.output.write('>S>Script ' + str(script_path) + ' started.')
+
+			# For each line execute self.onecmd(line)
+			for script_line_no, script_line in enumerate(script_lines, 1):
+				
+				# Substitute the parameters in the particular command in the script (look for the $key in the params_dict)
+				# and substitute it with the value.
+				cmd_line = script_line.strip()
+				
+				# Replace all the keys found in the params_dict
+				if params_pattern: cmd_line = params_pattern.sub(lambda match: params_dict[match.group(1)], cmd_line)
+
+				# Execute the command, now when all parameters are substituted with their values
+				#print(f'About to execute following cmd: {cmd_line=}')
+				error = self._fast_onecmd(cmd_line)
+				if error: raise RuntimeError(error)
 			
 			# Inform that script has ended
 			if verbose_mode: self.output.write('>S>Script finished successfully.')
@@ -307,7 +463,7 @@ class CommandLineProcessor(cmd.Cmd):
 		except FileNotFoundError:
 			self.output.write('Script file "' + str(script_path) + '" not found.')
 			return -1
-		except:
+		except Exception:
 			if not script_line: 
 				self.output.write('Error loading script file "' + str(script_path) + '".')
 			else:
@@ -344,7 +500,7 @@ class Header:
 			font_color (optional, default (255,255,255)): Font color as tuple with 3 values. Eg. (255,255,255) for white.
 			font_bck_color (optional, default None): Font text background color as tuple with 3 values. Eg. (255,255,255) for white.
 			bck_color (optional, default (0,0,0)): Color of the header background as tuple with 3 values.  Eg. (255,255,255) for white.
-			bck_image (optional, default None): Path to image displayed on the Header background.
+			bck_image (optional, default None): Path to image displayed on the Header background. It is converted to the display pixel format.
 			bck_image_resize (optional, default True): True/False, if image should be adjusted to header dimensions.
 			bck_alpha (optional, default 255): 0-255, if header background should be transparent
 		'''
@@ -386,6 +542,11 @@ class Header:
 			# if self.text_params are not defined, continue
 			pass
 
+		# Resolve the functions providing the dynamic text
+		self.bind_text_params()
+
+		# Header without dynamic data - the text is rendered once and update has nothing to do
+		self.is_static = not self.text_params
 
 		# Instantiate padding for further use
 		self.padding = Padding(self.padding)
@@ -395,8 +556,33 @@ class Header:
 		self.layout_name = self.layout[0] if len(self.layout) > 0 and self.layout[0] in Header.LAYOUTS else 'TEXT_LEFT'
 		self.scroll_last_time = pygame.time.get_ticks()
 		self.scroll_offset = 0
-		self.scroll_offset_speed_ms = self.layout[1] if len(self.layout) > 1 else 1
-		self.scroll_offset_speed_px = self.layout[2] if len(self.layout) > 2 else 1
+		# Scrolling is done in whole pixels, so that blit positions need no conversion when shown
+		self.scroll_offset_speed_ms = int(self.layout[1]) if len(self.layout) > 1 else 1
+		self.scroll_offset_speed_px = int(self.layout[2]) if len(self.layout) > 2 else 1
+
+		# Resolve the layout to its show method once, so that show() does not test the layout name every frame
+		self._show_layout = {
+			'TEXT_LEFT' : self._show_text_left,
+			'TEXT_RIGHT' : self._show_text_right,
+			'TEXT_CENTRE' : self._show_text_centre,
+			'SCROLL_LEFT' : self._show_scroll,
+			'SCROLL_RIGHT' : self._show_scroll,
+			'SCROLL_LEFT_CONTINUOUS' : self._show_scroll_left_continuous,
+			'SCROLL_RIGHT_CONTINUOUS' : self._show_scroll_right_continuous
+		}[self.layout_name]
+
+		# Scrolling layouts move the text before it is shown - None for the layouts with text not moving
+		self._scroll_layout = {
+			'SCROLL_LEFT' : self._scroll_left,
+			'SCROLL_RIGHT' : self._scroll_right,
+			'SCROLL_LEFT_CONTINUOUS' : self._scroll_left_continuous,
+			'SCROLL_RIGHT_CONTINUOUS' : self._scroll_right_continuous
+		}.get(self.layout_name)
+
+		# Opaque background with text not moving - the text is composed with the background to one surface
+		# that is blitted every frame instead of both of them. Not done for scrolling text, which would be
+		# composed again every time it moves.
+		self._compose_text = self.bck_alpha >= 255 and self._scroll_layout is None
 
 		''' Font and surface related params
 			*******************************
@@ -413,8 +599,7 @@ class Header:
 			- fnt_bck_surf_dim ... dimensions (Rect) of the text background
 		''' 
 
-		pygame.freetype.init() 
-		self.font_object = pygame.freetype.Font(str(self.font_file), self.font_size)
+		self.font_object = _get_font(str(self.font_file), self.font_size)
 
 		# Get the height of the text font line and store it in line_spacing
 		# This is necessary so that the hight of the row spacing is not
@@ -426,14 +611,14 @@ class Header:
 		# Create the main header surface
 		#####
 		self.surf_dim = pygame.Rect(0, 0, self.width, self.line_spacing + self.padding.up + self.padding.down)
-		self.surf = pygame.Surface((int(self.surf_dim.width), int(self.surf_dim.height)))
+		self.surf = _convert_surface(pygame.Surface((int(self.surf_dim.width), int(self.surf_dim.height))))
 
 		# Fill the header surface with background color
 		self.surf.fill(self.bck_color)
 		
 		# Fill the surface with picture	if necessary
 		if self.bck_image:
-			self.bck_image = pygame.image.load(str(self.bck_image)).convert()
+			self.bck_image = _convert_surface(pygame.image.load(str(self.bck_image)))
 			if self.bck_image_resize:
 				self.bck_image = pygame.transform.scale(self.bck_image, (self.surf_dim.width, self.surf_dim.height))
 			
@@ -453,22 +638,24 @@ class Header:
 						self.surf_dim.height - self.padding.up - self.padding.down
 						)
 
-		self.txt_surf = pygame.Surface(
+		self.txt_surf = _convert_surface(pygame.Surface(
 							(self.txt_surf_dim.width, self.txt_surf_dim.height),
-							pygame.SRCALPHA)
+							pygame.SRCALPHA), alpha=True)
 		
 		#####
 		# Create surface for text and store its dimensions
 		#####
 		(self.fnt_txt_surf, self.fnt_txt_surf_dim) = self.font_object.render(self.text, self.font_color, None)
+		self._last_text = self.text # last rendered text, so that unchanged text is not rendered again
+		self._last_key = None # last text and values of text_params, so that unchanged ones are not formatted again
+		self._txt_surf_dirty = True # the text needs to be blitted on txt_surf
+		self._shown_scroll_offset = self.scroll_offset # scrolling offset of the text on txt_surf
+		self._version = 0 # incremented whenever txt_surf is redrawn - used by the console frame cache
 
 		#####
 		# Create surface for text background if needed
 		#####
-		if self.font_bck_color:
-			self.fnt_bck_surf_dim = self.fnt_txt_surf_dim
-			self.fnt_bck_surf = pygame.Surface((self.fnt_txt_surf_dim.width, self.line_spacing))
-			self.fnt_bck_surf.fill(self.font_bck_color)
+		if self.font_bck_color: self._create_fnt_bck_surf()
 
 		#####
 		# Scrolling parameters
@@ -485,113 +672,221 @@ class Header:
 		# Only do something if dynamic params are needed. Otherwise, it is not necessary
 		if self.text_params:
 			
-			# prepare the dynamic text
+			# prepare the dynamic text - formatted only if the text or the values of the params changed since the last time.
+			# The text is part of the key as it can be assigned directly, not only by set_text.
 			try:
-				text = self.text.format(*[getattr(pack_method[0], pack_method[1])() for pack_method in self.text_params])				
+				if self._getters is None: raise AttributeError
+				key = (self.text, tuple([getter() for getter in self._getters])) # functions resolved by bind_text_params
+				if key == self._last_key: return
+				text = self.text.format(*key[1])
 			except AttributeError:
+				key = None
 				text = f"Missing function in'{self.text_params}'"
+			self._last_key = key
+
+			self._render_text(text)
+
+	def set_text(self, text):
+		''' Changes the header text. Static text is rendered immediately,
+		text with dynamic data on the next update.
+		'''
+		self.text = text
+		self._last_key = None
+
+		if self.is_static: self._render_text(text)
+
+	def _render_text(self, text):
+		''' Renders the text into fnt_txt_surf and adjusts the scrolling parameters.
+		'''
+		# Nothing to do if the text has not changed since the last time
+		if text == self._last_text: return
+		self._last_text = text
+		self._txt_surf_dirty = True
 
-			# generate the new text in self.text_surface object
-			(self.fnt_txt_surf, self.fnt_txt_surf_dim) = self.font_object.render(text, self.font_color, None )
+		# generate the new text in self.text_surface object
+		fnt_txt_width = self.fnt_txt_surf_dim.width
+		(self.fnt_txt_surf, self.fnt_txt_surf_dim) = render_text(self.font_object, text, self.font_color)
 
-			# How many times the text for scrolling must be blitted to create the continuation effect
-			if self.layout_name in ['SCROLL_LEFT_CONTINUOUS', 'SCROLL_RIGHT_CONTINUOUS']:
-				self.scroll_repeats = (self.txt_surf_dim.width // self.fnt_txt_surf_dim.width) + 2
+		# Text background must have the width of the text - created again only if the width changed
+		if self.font_bck_color and self.fnt_txt_surf_dim.width != fnt_txt_width: self._create_fnt_bck_surf()
+
+		# How many times the text for scrolling must be blitted to create the continuation effect - changes only with the text width
+		if self.fnt_txt_surf_dim.width != fnt_txt_width and self.layout_name in ['SCROLL_LEFT_CONTINUOUS', 'SCROLL_RIGHT_CONTINUOUS']:
+			self.scroll_repeats = (self.txt_surf_dim.width // self.fnt_txt_surf_dim.width) + 2
+
+	def _create_fnt_bck_surf(self):
+		''' Creates the text background surface of the current text width.
+		'''
+		self.fnt_bck_surf_dim = self.fnt_txt_surf_dim
+		self.fnt_bck_surf = _convert_surface(pygame.Surface((self.fnt_txt_surf_dim.width, self.line_spacing)))
+		self.fnt_bck_surf.fill(self.font_bck_color)
+
+	def bind_text_params(self):
+		''' Resolves the package-method pairs in text_params to the functions called
+		on every update, so that they are not looked up by name every frame.
+		Must be called again whenever text_params change.
+		'''
+		try:
+			self._getters = tuple([getattr(package, method) for package, method in self.text_params])
+		except AttributeError:
+			# missing function - reported in the text on update
+			self._getters = None
 
 	def show(self, surf, pos=(0, 0)):
 		''' Blit the surfaces to the main Header surface (surf).
+		Nothing is done if the header is outside of the clipping area of surf, e.g. while
+		the console is being animated. Scrolling text does not move in such case.
 		'''
 
-		# Blit the main header surface to background
-		surf.blit(self.surf, (int(pos[0]), int(pos[1])) )
+		surf.blits(self._collect_blits(pos, surf.get_clip()), False)
 
-		# Clear the main text surface on which the actual text is blitted
-		self.txt_surf.fill((0,0,0,0)) # Last 0 indicates alpha, i.e. full transparency
+	def _collect_blits(self, origin, clip):
+		''' Prepares the header surfaces and returns the sequence of (surface, position) pairs
+		to be blitted for the header placed at origin. The sequence is empty if the header
+		is outside of the clip rect.
+		'''
 
-		if self.layout_name == 'TEXT_RIGHT':
-			if self.font_bck_color: self.txt_surf.blit(self.fnt_bck_surf, (int(self.txt_surf_dim.width - self.fnt_txt_surf_dim.width), 0))
-			self.txt_surf.blit(self.fnt_txt_surf, (int(self.txt_surf_dim.width - self.fnt_txt_surf_dim.width), 0))			
+		# Nothing to show if the header would not be visible at all
+		if not self.surf_dim.move(origin).colliderect(clip): return []
 
-		if self.layout_name == 'TEXT_LEFT':
-			if self.font_bck_color: self.txt_surf.blit(self.fnt_bck_surf, (0,0))
-			self.txt_surf.blit(self.fnt_txt_surf, (0,0))
+		# Scrolling text is moved first - the offset changes only every scroll_offset_speed_ms
+		if self._scroll_layout: self._scroll_layout()
 
-		if self.layout_name == 'TEXT_CENTRE':
-			if self.font_bck_color: self.txt_surf.blit(self.fnt_bck_surf, (int(self.txt_surf_dim.width // 2 - self.fnt_text_surf_dim.width // 2), 0))
-			self.txt_surf.blit(self.fnt_txt_surf, (int(self.txt_surf_dim.width // 2 - self.fnt_txt_surf_dim.width // 2), 0))
+		# The text stays on txt_surf between the frames - it is cleared and blitted again only if it
+		# changed or moved since the last time
+		if self._txt_surf_dirty or self.scroll_offset != self._shown_scroll_offset:
+			self._shown_scroll_offset = self.scroll_offset
 
-		if self.layout_name == 'SCROLL_LEFT':
-			if self.scroll_offset > -1 * self.fnt_txt_surf_dim.width:
-				self.scroll_offset = (self.scroll_offset - self.scroll_offset_speed)  
-			else: 
-				self.scroll_offset = self.txt_surf_dim.width
+			# Clear the main text surface on which the actual text is blitted
+			self.txt_surf.fill((0,0,0,0)) # Last 0 indicates alpha, i.e. full transparency
 
-			if self.font_bck_color: self.txt_surf.blit(self.fnt_bck_surf, (int(self.scroll_offset), 0))
-			self.txt_surf.blit(self.fnt_txt_surf, (int(self.scroll_offset), 0))
+			# Blit the text of the layout resolved at init
+			self._show_layout()
+			self._txt_surf_dirty = False
+			self._version += 1
 
-		if self.layout_name == 'SCROLL_RIGHT':
-			if self.scroll_offset < 1 * self.txt_surf_dim.width:
-				self.scroll_offset = (self.scroll_offset + self.scroll_offset_speed)
-			else: 
-				self.scroll_offset = -1 * self.fnt_txt_surf_dim.width
+			if self._compose_text:
+				self._composed = self.surf.copy()
+				self._composed.blit(self.txt_surf, (self.padding.left, self.padding.up))
 
-			if self.font_bck_color: self.txt_surf.blit(self.fnt_bck_surf, (int(self.scroll_offset), 0))
-			self.txt_surf.blit(self.fnt_txt_surf, (int(self.scroll_offset), 0))
+		if self._compose_text:
+			return [(self._composed, (int(origin[0]), int(origin[1])))]
 
-		if self.layout_name == 'SCROLL_LEFT_CONTINUOUS':
+		# The main header surface and the text surface on it - take account text padding
+		return [(self.surf, (int(origin[0]), int(origin[1]))),
+				(self.txt_surf, (int(origin[0] + self.padding.left), int(origin[1] + self.padding.up)))]
 
-			# If the time for scrolling comes
-			current_time = pygame.time.get_ticks()
+	def _show_text_left(self):
+		''' Blit the text aligned to the left border of the text surface.
+		'''
+		if self.font_bck_color: self.txt_surf.blit(self.fnt_bck_surf, (0,0))
+		self.txt_surf.blit(self.fnt_txt_surf, (0,0))
 
-			# Calculate how much time has passed since last time (ms)
-			delay = current_time - self.scroll_last_time
+	def _show_text_right(self):
+		''' Blit the text aligned to the right border of the text surface.
+		'''
+		x = self.txt_surf_dim.width - self.fnt_txt_surf_dim.width
+		if self.font_bck_color: self.txt_surf.blit(self.fnt_bck_surf, (x, 0))
+		self.txt_surf.blit(self.fnt_txt_surf, (x, 0))
 
-			if delay >= self.scroll_offset_speed_ms:
-				
-				# Reset the scrolling time check
-				self.scroll_last_time = current_time
-				
-				# Increase the offset by given number of pixels
-				self.scroll_offset = (self.scroll_offset - self.scroll_offset_speed_px)
+	def _show_text_centre(self):
+		''' Blit the text in the middle of the text surface.
+		'''
+		x = self.txt_surf_dim.width // 2 - self.fnt_txt_surf_dim.width // 2
+		if self.font_bck_color: self.txt_surf.blit(self.fnt_bck_surf, (x, 0))
+		self.txt_surf.blit(self.fnt_txt_surf, (x, 0))
 
-				# Check if scrolling needs to be reset and reset if necessary
-				if self.scroll_offset < -1 * self.fnt_txt_surf_dim.width:
-					self.scroll_offset = 0
+	def _show_scroll(self):
+		''' Blit the text at the scrolling offset (SCROLL_LEFT and SCROLL_RIGHT layouts).
+		'''
+		x = self.scroll_offset
+		if self.font_bck_color: self.txt_surf.blit(self.fnt_bck_surf, (x, 0))
+		self.txt_surf.blit(self.fnt_txt_surf, (x, 0))
 
-			for i in range(self.scroll_repeats): 
-				if self.font_bck_color: self.txt_surf.blit(self.fnt_bck_surf, (int(i * self.fnt_txt_surf_dim.width + self.scroll_offset), 0))
-				self.txt_surf.blit(self.fnt_txt_surf, (int(i * self.fnt_txt_surf_dim.width + self.scroll_offset), 0))
+	def _show_scroll_left_continuous(self):
+		''' Blit the text as many times as needed to fill the whole text surface.
+		'''
+		fnt_w = self.fnt_txt_surf_dim.width
 
-		if self.layout_name == 'SCROLL_RIGHT_CONTINUOUS':
+		# All the copies of the text are blitted in one call
+		off = self.scroll_offset
+		self.txt_surf.blits(self._scroll_blits(i * fnt_w + off for i in range(self.scroll_repeats)), False)
 
-			# If the time for scrolling comes
-			current_time = pygame.time.get_ticks()
+	def _show_scroll_right_continuous(self):
+		''' Blit the text as many times as needed to fill the whole text surface
+		from the right border.
+		'''
+		fnt_w = self.fnt_txt_surf_dim.width
 
-			# Calculate how much time has passed since last time (ms)
-			delay = current_time - self.scroll_last_time
+		# blit the text to the right border. Then subtract text width and blit again as many times as needed.
+		# All the copies of the text are blitted in one call
+		off = self.txt_surf_dim.width + self.scroll_offset
+		self.txt_surf.blits(self._scroll_blits(off - (i+1) * fnt_w for i in range(self.scroll_repeats)), False)
 
-			if delay >= self.scroll_offset_speed_ms:
-				
-				# Reset the scrolling time check
-				self.scroll_last_time = current_time
-				
-				# Increase the offset by given number of pixels
-				self.scroll_offset = (self.scroll_offset + self.scroll_offset_speed_px)
+	def _scroll_time(self):
+		''' Returns True if the time for moving the scrolling text came, i.e. scroll_offset_speed_ms
+		passed since the last move.
+		'''
+		current_time = pygame.time.get_ticks()
+		if current_time - self.scroll_last_time < self.scroll_offset_speed_ms: return False
 
-				# Check if scrolling needs to be reset and reset if necessary
-				if self.scroll_offset > self.fnt_txt_surf_dim.width:
-					self.scroll_offset = 0
+		# Reset the scrolling time check
+		self.scroll_last_time = current_time
+		return True
 
-			for i in range(self.scroll_repeats): 
-				# blit the text to the right border. Then subtract text width and blit again as many times as needed
-				if self.font_bck_color: self.txt_surf.blit(self.fnt_bck_surf, (int(self.txt_surf_dim.width - (i+1) * self.fnt_txt_surf_dim.width + self.scroll_offset), 0))
-				self.txt_surf.blit(self.fnt_txt_surf, (int(self.txt_surf_dim.width - (i+1) * self.fnt_txt_surf_dim.width + self.scroll_offset), 0))
+	def _scroll_left(self):
+		''' Move the text to the left. The text enters again from the right border
+		once it leaves the text surface.
+		'''
+		if self._scroll_time():
+			if self.scroll_offset > -1 * self.fnt_txt_surf_dim.width:
+				self.scroll_offset = self.scroll_offset - self.scroll_offset_speed_px
+			else:
+				self.scroll_offset = self.txt_surf_dim.width
 
-		
-		# Blit text surface to surf - take account text padding
-		surf.blit(self.txt_surf, 
-				(int(pos[0] + self.padding.left),
-				int(pos[1] + self.padding.up)))
+	def _scroll_right(self):
+		''' Move the text to the right. The text enters again from the left border
+		once it leaves the text surface.
+		'''
+		if self._scroll_time():
+			if self.scroll_offset < 1 * self.txt_surf_dim.width:
+				self.scroll_offset = self.scroll_offset + self.scroll_offset_speed_px
+			else:
+				self.scroll_offset = -1 * self.fnt_txt_surf_dim.width
+
+	def _scroll_left_continuous(self):
+		''' Move the repeated text to the left by given number of pixels.
+		'''
+		if self._scroll_time():
+
+			# Increase the offset by given number of pixels
+			self.scroll_offset = (self.scroll_offset - self.scroll_offset_speed_px)
+
+			# Check if scrolling needs to be reset and reset if necessary
+			if self.scroll_offset < -1 * self.fnt_txt_surf_dim.width:
+				self.scroll_offset = 0
+
+	def _scroll_right_continuous(self):
+		''' Move the repeated text to the right by given number of pixels.
+		'''
+		if self._scroll_time():
+
+			# Increase the offset by given number of pixels
+			self.scroll_offset = (self.scroll_offset + self.scroll_offset_speed_px)
+
+			# Check if scrolling needs to be reset and reset if necessary
+			if self.scroll_offset > self.fnt_txt_surf_dim.width:
+				self.scroll_offset = 0
+
+	def _scroll_blits(self, xs):
+		''' Returns the blit sequence of the text (preceded by its background, if any)
+		at the given x positions for the continuous scrolling layouts.
+		'''
+		fnt_surf = self.fnt_txt_surf
+		if self.font_bck_color:
+			bck_surf = self.fnt_bck_surf
+			return [blit for x in xs for blit in ((bck_surf, (x, 0)), (fnt_surf, (x, 0)))]
+		return [(fnt_surf, (x, 0)) for x in xs]
 
 	def get_height(self):
 		''' Returns hight of the header surface. Called from Console instance in order
@@ -655,10 +950,17 @@ class TextOutput:
 
 		''' Buffer related parameters
 		'''
-		# Stores list of past texts
-		self.buffer = []
+		# Stores list of past texts - the oldest ones are dropped automatically when the buffer is full
+		self.buffer = deque(maxlen=self.buffer_size)
 		# Necessary for implemetation of scrolling in the output buffer (PgUp, PgDown)
 		self.buffer_offset = 0	
+		# Rendered buffer lines - (text, color) : [(surface, vertical offset), number of such lines in the buffer]
+		self._line_cache = {}
+		# Surfaces are generated again only if the buffer or the displayed part of it changed
+		self._dirty = True
+		self._last_state = None
+		# Incremented whenever the output surfaces are redrawn - used by the console frame cache
+		self._version = 0
 
 		''' Font and surface related params - part of prepare_surface and show functions
 			*******************************
@@ -675,8 +977,7 @@ class TextOutput:
 			- fnt_bck_surf_dim ... dimensions (Rect) of the text background
 		''' 
 
-		pygame.freetype.init() 
-		self.font_object = pygame.freetype.Font(str(self.font_file), self.font_size)
+		self.font_object = _get_font(str(self.font_file), self.font_size)
 
 		# Get the height of the text font line and store it in line_spacing
 		# This is necessary so that the hight of the row spacing is not
@@ -685,6 +986,12 @@ class TextOutput:
 			(_, rect_tmp) = self.font_object.render('|q', self.font_color, None)
 			self.line_spacing = rect_tmp.height
 
+		# How many characters can we put one one line - minimal from setup and what can fit on the screen
+		self.display_columns = min(self.display_columns, self.width // self.font_object.get_metrics("_")[0][1])
+
+		# Text substituted for tabs in the output
+		self._tab_text = self.tab_spaces * ' '
+
 		# Create the main surface and tex_surf
 		self.prepare_surface()
 
@@ -694,16 +1001,30 @@ class TextOutput:
 		function to blit to the screen.
 		'''
 
-		# First we need to clear all the buffer surfaces
-		self.surf_lines = []
-
-		# We fill the surf_lines list with buffer lines surfaces based on buffer offset and 
-		# number of lines that we want to display
-		for i in range(self.buffer_offset, min([len(self.buffer), self.buffer_offset + self.display_lines])):
-			# Create font object with given text and given color
-			# TODO - to check if the self.prompt must be on the line below???
-			(surface_line_tmp, rect_tmp) = self.font_object.render(self.prompt + self.buffer[i][0], self.buffer[i][1], None)
-			self.surf_lines.append( (surface_line_tmp, rect_tmp) )
+		# Nothing to do if neither the buffer nor its displayed part changed since the last time
+		state = (self.buffer_offset, self.display_lines)
+		if not self._dirty and state == self._last_state: return
+		self._dirty = False
+		self._last_state = state
+
+		# The lines on txt_surf need to be blitted again
+		self._txt_surf_dirty = True
+
+		# We fill the surf_lines list with buffer lines surfaces and their vertical offsets based on buffer
+		# offset and number of lines that we want to display. The list is built in one go in its final size.
+		# TODO - to check if the self.prompt must be on the line below???
+		line_surface = self._line_surface
+		self.surf_lines = [line_surface(line) for line in islice(self.buffer, self.buffer_offset, self.buffer_offset + self.display_lines)]
+
+		# Sequence of the line surfaces and their positions on txt_surf used by show - the positions
+		# are computed here once and not every frame. The font background is part of the line surfaces.
+		# Lines completely outside of txt_surf (possible with line_spacing smaller than the font) are left out.
+		line_spacing = self.line_spacing
+		txt_height = line_spacing * len(self.surf_lines)
+		self._line_blits = blits = []
+		for i, (fnt_txt_surf, fnt_txt_offset) in enumerate(self.surf_lines):
+			y = int(i * line_spacing + fnt_txt_offset)
+			if -fnt_txt_surf.get_height() < y < txt_height: blits.append((fnt_txt_surf, (0, y)))
 
 		# Calculate the dimensions of test output surface
 		self.surf_dim = pygame.Rect(
@@ -713,8 +1034,12 @@ class TextOutput:
 									(self.line_spacing * len(self.surf_lines)) + self.padding.up + self.padding.down
 		)
 
+		# The surfaces depend only on the dimensions - keep the existing ones if the
+		# number of displayed lines has not changed (txt_surf is cleared in show anyway)
+		if getattr(self, 'surf', None) is not None and self.surf.get_size() == self.surf_dim.size: return
+
 		# And create the surface from scratch again
-		self.surf = pygame.Surface((self.surf_dim.width, self.surf_dim.height))
+		self.surf = _convert_surface(pygame.Surface((self.surf_dim.width, self.surf_dim.height)))
 
 		# Fill the output surface with background color
 		self.surf.fill(self.bck_color)
@@ -733,78 +1058,87 @@ class TextOutput:
 									self.surf_dim.height - self.padding.up - self.padding.down
 		)
 
-		self.txt_surf = pygame.Surface((self.txt_surf_dim.width, self.txt_surf_dim.height), pygame.SRCALPHA)
+		self.txt_surf = _convert_surface(pygame.Surface((self.txt_surf_dim.width, self.txt_surf_dim.height), pygame.SRCALPHA), alpha=True)
 
 	def show(self, surf, pos=(0,0)):
 		''' Blits main surface, text cut surface and all individual lines to
-		the given surface.
+		the given surface. Nothing is done if the output is outside of the clipping area of surf.
 		'''		
+
+		surf.blits(self._collect_blits(pos, surf.get_clip()), False)
+
+	def _collect_blits(self, origin, clip):
+		''' Prepares the output surfaces and returns the sequence of (surface, position) pairs
+		to be blitted for the output placed at origin. The sequence is empty if the output
+		is outside of the clip rect.
+		'''
+
+		# Nothing to show if the output would not be visible at all
+		if not self.surf_dim.move(origin).colliderect(clip): return []
 		
-		# Blit output background
-		surf.blit(self.surf, (int(pos[0]), int(pos[1])))
+		# The text lines stay on txt_surf between the frames - it is cleared and the lines are
+		# blitted again only if they changed since the last time (see prepare_surface)
+		if self._txt_surf_dirty:
+			self._txt_surf_dirty = False
+			self._version += 1
 
-		# Clear the main text input surf on which the actual text is blitted
-		self.txt_surf.fill((0,0,0,0)) # Last 0 indicates alpha, i.e. full transparency
+			# Clear the main text input surf on which the actual text is blitted
+			self.txt_surf.fill((0,0,0,0)) # Last 0 indicates alpha, i.e. full transparency
 
-		# Blit all the line surfaces to the txt_surface
-		height = 0
-		for i in range(len(self.surf_lines)):
-			
-			# Get the line surface from the list
-			(fnt_txt_surf, fnt_txt_surf_dim) = self.surf_lines[i]
+			# Blit all the line surfaces to the txt_surface in one call
+			self.txt_surf.blits(self._line_blits, False)
 
-			# Blit font background
-			if self.font_bck_color:
-				fnt_bck_surf = pygame.Surface((fnt_txt_surf_dim.width, fnt_txt_surf_dim.height))
-				fnt_bck_surf.fill(self.font_bck_color)
-				
-				self.txt_surf.blit(fnt_bck_surf,
-						(0,
-						int(height + self.line_spacing - (( self.line_spacing - fnt_txt_surf_dim.height) // 2) - fnt_txt_surf_dim.height)))
+			# Opaque background - compose it with the text lines to one surface that is blitted
+			# every frame instead of both of them. Not possible with transparent background
+			# as the game screen below the output changes every frame.
+			if self.bck_alpha >= 255:
+				self._composed = self.surf.copy()
+				self._composed.blit(self.txt_surf, (self.padding.left, self.padding.up))
 
-			self.txt_surf.blit(fnt_txt_surf, 
-						(0,
-						int(height + self.line_spacing - (( self.line_spacing - fnt_txt_surf_dim.height) // 2) - fnt_txt_surf_dim.height)))
+		if self.bck_alpha >= 255:
+			return [(self._composed, (int(origin[0]), int(origin[1])))]
 
-			height = height + self.line_spacing
-		
-		# Blit text surface to surf - take account text padding
-		surf.blit(self.txt_surf, 
-				(int(pos[0] + self.padding.left),
-				int(pos[1] + self.padding.up)))
+		# Output background and the text surface on it - take account text padding
+		return [(self.surf, (int(origin[0]), int(origin[1]))),
+				(self.txt_surf, (int(origin[0] + self.padding.left), int(origin[1] + self.padding.up)))]
 
 	def update(self, events):
 		''' Handles scrolling the output buffer by pressing pgUP and pgDOWN keys.
 		After pressing of those keys and also RETURN key, it is necessary to run
-		prepare_surface function in order to generate new surfaces.
+		prepare_surface function in order to generate new surfaces. It is run
+		only once, after all the events of the frame are processed.
 		'''
 
+		scrolled = False
+
 		for event in events:
 			if event.type == pygame.KEYDOWN:
 
 				if event.key == pl.K_PAGEUP:
-					self.buffer_offset = max([0, self.buffer_offset - self.display_lines])
-					self.prepare_surface()
+					self.buffer_offset = max(0, self.buffer_offset - self.display_lines)
+					scrolled = True
 
 				elif event.key == pl.K_PAGEDOWN:
-					self.buffer_offset = min([max([0, len(self.buffer) - self.display_lines]), self.buffer_offset + self.display_lines])
-					self.prepare_surface()
+					self.buffer_offset = min(max(0, len(self.buffer) - self.display_lines), self.buffer_offset + self.display_lines)
+					scrolled = True
 
 				elif event.key == pl.K_RETURN:
-					self.buffer_offset = max([0, len(self.buffer) - self.display_lines])
-					self.prepare_surface()
-			
+					self.buffer_offset = max(0, len(self.buffer) - self.display_lines)
+					scrolled = True
+
 			elif event.type == pygame.MOUSEBUTTONDOWN:
 
 				# On mouse roll button UP - one row up
 				if event.button == 4:
-					self.buffer_offset = max([0, self.buffer_offset - 1])
-					self.prepare_surface()
+					self.buffer_offset = max(0, self.buffer_offset - 1)
+					scrolled = True
 
 				# On mouse roll button DOWN - one row down
 				elif event.button == 5:
-					self.buffer_offset = min([max([0, len(self.buffer) - 1]), self.buffer_offset + 1])
-					self.prepare_surface()
+					self.buffer_offset = min(max(0, len(self.buffer) - 1), self.buffer_offset + 1)
+					scrolled = True
+
+		if scrolled: self.prepare_surface()
 
 	def write(self, text, color=None):
 		''' Handles adding output text into textoutput buffer in given color
@@ -812,37 +1146,110 @@ class TextOutput:
 		'''	
 
 		# If color of the putput text is not specifically given, use predefined color
-		if not color: color = self.font_color
+		color = tuple(color) if color else tuple(self.font_color)
 
 		# Remove newline at the end
-		text.rstrip()
+		text = text.rstrip('\n')
 
-		# Substitute tabs with predefined number of spaces
-		text = text.replace('\t', self.tab_spaces * ' ') 
+		# Substitute tabs with predefined number of spaces - only if there are some
+		if '\t' in text: text = text.replace('\t', self._tab_text)
 	
+		# Attributes used for every output line - looked up once
+		display_columns = self.display_columns
+		buffer = self.buffer
+		line_cache = self._line_cache
+
 		# Based on newline character put every output line on separate row
 		for text_line in text.split('\n'):
-			
+
 			# Only print if there is something to print
 			if text_line:
 
-				# How many characters can we put one one line - minimal from setup and what can fit on the screen
-				self.display_columns = min(self.display_columns, self.width // self.font_object.get_metrics("_")[0][1])
-				
-				# Split text_line to the list of strings based on number of displayable characters
-				text_line_parts = [text_line[i:i+self.display_columns] for i in range(0, len(text_line), self.display_columns)]	
+				# Split text_line to the strings based on number of displayable characters. Short lines,
+				# which are the most common, are used as they are without slicing.
+				if len(text_line) <= display_columns:
+					text_line_parts = (text_line,)
+				else:
+					text_line_parts = (text_line[i:i+display_columns] for i in range(0, len(text_line), display_columns))
 
 				# Add every splitted string into the output buffer
 				for text_line_part in text_line_parts:
-					
-					self.buffer.append((text_line_part, color))
-
-					# Remove old rows from the buffer
-					if len(self.buffer) > self.buffer_size:
-						for i in range(1,len(self.buffer)):
-							self.buffer[i-1] = self.buffer[i]
-						del self.buffer[len(self.buffer)-1]
+
+					line = (text_line_part, color)
+
+					# Render the new line only once - it is taken from the cache whenever displayed
+					cached = line_cache.get(line)
+					if cached is None:
+						cached = line_cache[line] = [self._render_line(text_line_part, color), 0]
+					cached[1] += 1
+
+					# The oldest row is dropped from the full buffer by the append
+					if len(buffer) == buffer.maxlen: self._release_line(buffer[0])
+
+					buffer.append(line)
+					self._dirty = True
 	
+	def _render_line(self, text, color):
+		''' Renders the buffer line and returns its (surface, vertical offset). The offset centres
+		the text within its line and is computed here once, as only the height of the text rect
+		is needed after rendering. If font background color is set, the text is rendered on it
+		and the surface is converted to opaque one - the line is then blitted by one fast blit
+		without per pixel alpha instead of blitting background and text.
+		'''
+		if self.font_bck_color:
+			(fnt_txt_surf, fnt_txt_surf_dim) = self.font_object.render(self.prompt + text, color, self.font_bck_color)
+			fnt_txt_surf = _convert_surface(fnt_txt_surf)
+		else:
+			(fnt_txt_surf, fnt_txt_surf_dim) = render_text(self.font_object, self.prompt + text, color)
+
+		return (fnt_txt_surf, self.line_spacing - ((self.line_spacing - fnt_txt_surf_dim.height) // 2) - fnt_txt_surf_dim.height)
+
+	def _line_surface(self, line):
+		''' Returns (surface, vertical offset) of the buffer line - from the line cache if available.
+		'''
+		cached = self._line_cache.get(line)
+		return cached[0] if cached is not None else self._render_line(*line)
+
+	def _release_line(self, line):
+		''' Called when the line is removed from the buffer. Rendered line is removed from
+		the line cache if there is no other such line in the buffer.
+		'''
+		cached = self._line_cache.get(line)
+		if cached is not None:
+			cached[1] -= 1
+			if cached[1] <= 0: del self._line_cache[line]
+
+	def mark_dirty(self):
+		''' Forces the next prepare_surface call to generate the surfaces again.
+		Needed if the buffer is changed directly, not by the write function.
+		'''
+		self._dirty = True
+
+	def set_buffer(self, lines, buffer_offset=0):
+		''' Replaces the buffer by the given (text, color) lines, e.g. by the buffer kept on console re-init.
+		The lines are rendered and counted in the line cache, the same way as the written ones.
+		'''
+		self.buffer = deque(lines, maxlen=self.buffer_size)
+		self.buffer_offset = buffer_offset
+
+		line_cache = self._line_cache = {}
+		for line in self.buffer:
+			cached = line_cache.get(line)
+			if cached is None:
+				cached = line_cache[line] = [self._render_line(*line), 0]
+			cached[1] += 1
+
+		self._dirty = True
+
+	def clear(self):
+		''' Removes all lines from the buffer. The buffer and the line cache are emptied
+		in place, so the references held to them stay valid.
+		'''
+		self.buffer.clear()
+		self._line_cache.clear()
+		self.buffer_offset = 0
+		self._dirty = True
+
 	def get_height(self):
 		''' Returns current height of the text output surface. 
 		Called from Console instance in order to construct all elements 
@@ -868,6 +1275,9 @@ class TextInput:
 
 	Original above modified heavilly in order to be used with the console.	
 	'''
+
+	# Maximum number of repeats of a held key in one frame
+	MAX_KEY_REPEATS = 10
 	
 	def __init__(self, console, width, config={}):
 		'''
@@ -925,12 +1335,12 @@ class TextInput:
 		# TODO- revise - Vars to make keydowns repeat after user pressed a key for some time:
 		self.keyrepeat_counters = {}
 
-		# TODO - revise - cannot we use console clocks? pygame.time_get_ticks instead
-		self.clock = pygame.time.Clock()
+		# Time of the last update - for measuring the time of key repeating and cursor blinking
+		self._last_tick_ms = pygame.time.get_ticks()
 
 		''' Buffer related parameters
 		'''
-		self.buffer = []
+		self.buffer = deque(maxlen=self.buffer_size) # the oldest inputs are dropped automatically when the buffer is full
 		self.buffer_offset = 0
 
 		''' Font and surface related params
@@ -949,8 +1359,7 @@ class TextInput:
 								the text so it does not cross the console borders
 			- fnt_bck_surf_dim ... dimensions (Rect) of the text background
 		''' 
-		pygame.freetype.init() 
-		self.font_object = pygame.freetype.Font(self.font_file, self.font_size)
+		self.font_object = _get_font(str(self.font_file), self.font_size)
 
 		# Determine automatically the hight of the row - height of '|q' string
 		# This prevents the surface to change its height upon different hight of 
@@ -962,7 +1371,7 @@ class TextInput:
 		# Create the main text input surface
 		##### 
 		self.surf_dim = pygame.Rect(0, 0, self.width, self.line_spacing + self.padding.up + self.padding.down)
-		self.surf = pygame.Surface((self.surf_dim.width, self.surf_dim.height))
+		self.surf = _convert_surface(pygame.Surface((self.surf_dim.width, self.surf_dim.height)))
 
 		# Fill the header surface with background color and set the transparency
 		self.surf.fill(self.bck_color)				
@@ -978,10 +1387,10 @@ class TextInput:
 						self.surf_dim.height - self.padding.up - self.padding.down
 						)
 
-		self.txt_surf = pygame.Surface(
+		self.txt_surf = _convert_surface(pygame.Surface(
 							(self.txt_surf_dim.width, self.txt_surf_dim.height),
 							pygame.SRCALPHA
-							)
+							), alpha=True)
 
 		#####
 		# Create surface for text and store its dimensions
@@ -993,7 +1402,7 @@ class TextInput:
 		#####
 		if self.font_bck_color:
 			self.fnt_bck_surf_dim = self.fnt_txt_surf_dim
-			self.fnt_bck_surf = pygame.Surface((self.fnt_bck_surf_dim.width, self.line_spacing))
+			self.fnt_bck_surf = _convert_surface(pygame.Surface((self.fnt_bck_surf_dim.width, self.line_spacing)))
 			self.fnt_bck_surf.fill(self.font_bck_color)
 
 		#####
@@ -1006,7 +1415,7 @@ class TextInput:
 							self.line_spacing
 							)
 
-		self.cursor_surf = pygame.Surface((self.cursor_surf_dim.width, self.cursor_surf_dim.height))
+		self.cursor_surf = _convert_surface(pygame.Surface((self.cursor_surf_dim.width, self.cursor_surf_dim.height)))
 		self.cursor_surf.fill(self.font_color)
 
 		# Additional cursor parameters
@@ -1015,9 +1424,29 @@ class TextInput:
 		self.cursor_switch_ms = 500  # cursor blinks every 500ms
 		self.cursor_ms_counter = 0 
 
+		# Text and cursor position the text surfaces were last composed for (see _compose)
+		self._composed_state = None
+		self._version = 0 # incremented on every _compose - used by the console frame cache
+
+		# Editing and cursor movement keys and their handlers - each returns True if the text was modified
+		self._key_handlers = {
+			pl.K_BACKSPACE : self._on_backspace,
+			pl.K_DELETE : self._on_delete,
+			pl.K_RIGHT : self._on_right,
+			pl.K_LEFT : self._on_left,
+			pl.K_END : self._on_end,
+			pl.K_HOME : self._on_home,
+			pl.K_UP : self._on_up,
+			pl.K_DOWN : self._on_down
+		}
+
 		# Necessary to blit cursore surface to the correct position - TODO - do we need this?? This is same rect as for text_input but it ends at the position of the cursor
 		#( _ , self.cursor_rect) = self.font_object.render (self.prompt + self.text[:self.cursor_position], self.font_color, None) 
-		self.cursor_blit_position = self.font_object.get_rect(self.prompt + self.text[:self.cursor_position]).width
+		# The position is the horizontal advance of the text before the cursor. It is adjusted by the advances of
+		# individual characters as the cursor moves, so that the whole text is not measured on every key press.
+		self._adv_cache = {} # horizontal advance of already measured characters
+		self._prompt_width = self._advance(self.prompt) # the prompt does not change - measured only once
+		self.cursor_blit_position = self._prompt_width + self._advance(self.text[:self.cursor_position])
 
 		#####
 		# Scrolling parameters
@@ -1031,22 +1460,31 @@ class TextInput:
 		where we handle text input and modification
 		'''
 		
-		# Re-render front and back text surface
-		(self.fnt_txt_surf, self.fnt_txt_surf_dim)  = self.font_object.render(self.prompt + self.text, self.font_color, None)
+		# Re-render front and back text surface - texts entered recently (e.g. recalled from the history
+		# or restored by deleting characters) are taken from the render cache shared by all the components
+		(self.fnt_txt_surf, self.fnt_txt_surf_dim)  = render_text(self.font_object, self.prompt + self.text, self.font_color)
 
+		# Only the part of the text background surface as wide as the text is blitted. The surface is
+		# created again only if the text gets wider than it - with space for more text to be typed.
 		if self.font_bck_color:
 			self.fnt_bck_surf_dim = self.fnt_txt_surf_dim
-			self.fnt_bck_surf = pygame.Surface((self.fnt_bck_surf_dim.width, self.line_spacing))
-			self.fnt_bck_surf.fill(self.font_bck_color)
+			if self.fnt_bck_surf_dim.width > self.fnt_bck_surf.get_width():
+				self.fnt_bck_surf = _convert_surface(pygame.Surface((max(self.fnt_bck_surf_dim.width, 2 * self.fnt_bck_surf.get_width()), self.line_spacing)))
+				self.fnt_bck_surf.fill(self.font_bck_color)
 
 		# Update scroll offset after input text is somehow modified
 		self.fnt_txt_scroll_offset =  min(0, int(self.txt_surf_dim.width - self.fnt_txt_surf_dim.width - self.cursor_surf_dim.width))
 
-	def update(self, events):
+	def update(self, events, now=None):
 		''' Handles pressing of the keys. After the press, it is necessary to run
 		prepare_surface function in order to update surfaces and their dimensions.
+		It is run only once, after all the events of the frame are processed.
+
+		Optional now is the time of the frame in ms (pygame.time.get_ticks()), read if not given.
 		'''
 
+		text_changed = False
+
 		#####
 		# Handle Key pressed
 		#####
@@ -1060,92 +1498,12 @@ class TextInput:
 				if event.key not in self.keyrepeat_counters:
 					self.keyrepeat_counters[event.key] = [0, event.unicode]
 
-				if event.key == pl.K_BACKSPACE:
-					self.text = (
-						self.text[:max(self.cursor_position - 1, 0)]
-						+ self.text[self.cursor_position:]
-					)
-					# Subtract one from cursor_pos, but do not go below zero:
-					self.cursor_position = max(self.cursor_position - 1, 0)
-					self.cursor_blit_position = self.font_object.get_rect(self.prompt + self.text[:self.cursor_position]).width
-
-					# Regenerate text surfaces
-					self.prepare_surface()
-
-				elif event.key == pl.K_DELETE:
-					self.text = (
-						self.text[:self.cursor_position]
-						+ self.text[self.cursor_position + 1:]
-					)
-					# Regenerate text surfaces
-					self.prepare_surface()
-
-				elif event.key in (pl.K_RETURN, pl.K_KP_ENTER): # support also enter on keypad
-					# Only store if there is something to store
-					if self.text:
-						self.buffer.append(self.text)
-						self.buffer_offset = len(self.buffer)
-
-						# Remove old rows from the buffer
-						if len(self.buffer) > self.buffer_size:
-							for i in range(1,len(self.buffer)):
-								self.buffer[i-1] = self.buffer[i]
-							del self.buffer[len(self.buffer)-1]
-							# Adjust the buffer offset to point to the last item in the list
-							self.buffer_offset = len(self.buffer) - 1
-
+				if event.key in (pl.K_RETURN, pl.K_KP_ENTER): # support also enter on keypad
 					# Important to return True so that console instance knows that it must process a command
-					return True
-
-				elif event.key == pl.K_RIGHT:
-					# Add one to cursor_pos, but do not exceed len(input_string)
-					self.cursor_position = min(self.cursor_position + 1, len(self.text))
-					self.cursor_blit_position = self.font_object.get_rect(self.prompt + self.text[:self.cursor_position]).width
-
-				elif event.key == pl.K_LEFT:
-					# Subtract one from cursor_pos, but do not go below zero:
-					self.cursor_position = max(self.cursor_position - 1, 0)
-					self.cursor_blit_position = self.font_object.get_rect(self.prompt + self.text[:self.cursor_position]).width
-
-
-				elif event.key == pl.K_END:
-					self.cursor_position = len(self.text)
-					self.cursor_blit_position = self.font_object.get_rect(self.prompt + self.text[:self.cursor_position]).width
-
-				elif event.key == pl.K_HOME:
-					self.cursor_position = 0
-					self.cursor_blit_position = self.font_object.get_rect(self.prompt + self.text[:self.cursor_position]).width
-
-				# Scroll the buffer - to the history
-				elif event.key == pl.K_UP:
-					# Only scroll if there is something in the buffer
-					if len(self.buffer) > 0:
-						# Calc new buffer position
-						if self.buffer_offset >= 1: self.buffer_offset = self.buffer_offset - 1
-						if len(self.buffer) == self.buffer_offset: self.buffer_offset = self.buffer_offset + 1 # fix
-						#print(f"{self.buffer_offset=}, {len(self.buffer)=}")
-						# Restore previous input string - last in buffer
-						self.text = self.buffer[self.buffer_offset]						
-						# Set cursor possition at the end of the string
-						self.cursor_position = len(self.text)
-						self.cursor_blit_position = self.font_object.get_rect(self.prompt + self.text[:self.cursor_position]).width
-
-						# Regenerate text surfaces
-						self.prepare_surface()
-
-				# Scroll the buffer - to the future
-				elif event.key == pl.K_DOWN:
-					# Calc new buffer position
-					if self.buffer_offset < len(self.buffer) - 1:
-						self.buffer_offset = self.buffer_offset + 1
-						# Restore previous input string - last in buffer
-						self.text = self.buffer[self.buffer_offset]
-						# Set cursor possition at the end of the string
-						self.cursor_position = len(self.text)
-						self.cursor_blit_position = self.font_object.get_rect(self.prompt + self.text[:self.cursor_position]).width
-
-						# Regenerate text surfaces
-						self.prepare_surface()
+					if text_changed: self.prepare_surface()
+					return self._enter()
+
+				if self._apply_key(event.key): text_changed = True
 
 			elif event.type == pygame.TEXTINPUT:
 				# Only add new characters if the max limit is not overreached
@@ -1159,81 +1517,222 @@ class TextInput:
 						+ self.text[self.cursor_position:]
 					)
 					self.cursor_position += len(event.text)  # Some are empty, e.g. K_UP
-					self.cursor_blit_position = self.font_object.get_rect(self.prompt + self.text[:self.cursor_position]).width
+					self.cursor_blit_position += self._advance(event.text)
 
-					# Regenerate text surfaces
-					self.prepare_surface()
+					# Text surfaces are regenerated after all the events are processed
+					text_changed = True
 
 			elif event.type == pl.KEYUP:
 				# *** Because KEYUP doesn't include event.unicode, this dict is stored in such a weird way
 				if event.key in self.keyrepeat_counters:
 					del self.keyrepeat_counters[event.key]
 
+		# Time passed since the last update
+		if now is None: now = pygame.time.get_ticks()
+		dt = now - self._last_tick_ms
+		self._last_tick_ms = now
+
 		#####
 		# Update key pressed times
 		#####
-		# TODO - revise - Update key counters
-		for key in self.keyrepeat_counters:
+		# Held keys are repeated in this frame - as many times as the intervals that have passed. The editing
+		# and cursor movement keys are applied directly. Other keys (e.g. RETURN, PgUp, PgDn) are posted
+		# as KEYDOWN events, so that they reach also the console output and the game on the next frame.
+		for key, counter in self.keyrepeat_counters.items():
 
-			self.keyrepeat_counters[key][0] += self.clock.get_time()  # Update clock			
+			counter[0] += dt  # Update clock			
 
-			if self.keyrepeat_counters[key][0] >= self.repeat_keys_initial_ms:
-				self.keyrepeat_counters[key][0] = (
-					self.repeat_keys_initial_ms
-					- self.repeat_keys_interval_ms
-				)
+			# At most MAX_KEY_REPEATS repeats, so that a long pause (e.g. hidden console) does not flood the input
+			for _ in range(self.MAX_KEY_REPEATS):
+				if counter[0] < self.repeat_keys_initial_ms: break
+				counter[0] -= self.repeat_keys_interval_ms
+				self.cursor_visible = True
 
-				event_key, event_unicode = key, self.keyrepeat_counters[key][1]
-				pygame.event.post(pygame.event.Event(pl.KEYDOWN, key=event_key, unicode=event_unicode))
+				handler = self._key_handlers.get(key)
+				if handler:
+					if handler(): text_changed = True
+				else:
+					pygame.event.post(pygame.event.Event(pl.KEYDOWN, key=key, unicode=counter[1]))
+			else:
+				counter[0] = min(counter[0], self.repeat_keys_initial_ms - self.repeat_keys_interval_ms)
 
+		# Regenerate text surfaces if the text was modified
+		if text_changed: self.prepare_surface()
 
 		#####
-		# Update cursor blink - TODO - revise - use console clock
+		# Update cursor blink
 		#####
-		self.cursor_ms_counter += self.clock.get_time()
+		self.cursor_ms_counter += dt
 		if self.cursor_ms_counter >= self.cursor_switch_ms:
 			self.cursor_ms_counter %= self.cursor_switch_ms
 			self.cursor_visible = not self.cursor_visible
-				
-		# TODO - revise - use console clock - clock must tick in order to see blinking cursor!
-		self.clock.tick()
 		
 		# Only if enter is pressed then True is returned, else False - important for the Console instance
 		return False
 
+	def _enter(self):
+		''' Stores the entered text in the input history. Returns True so that console
+		instance knows that it must process a command.
+		'''
+		# Only store if there is something to store
+		if self.text:
+			# Old rows are removed from the full buffer by the append
+			buffer_full = len(self.buffer) == self.buffer.maxlen
+			self.buffer.append(self.text)
+
+			# Point behind the last item in the list - or to the last item if the oldest one was removed
+			self.buffer_offset = len(self.buffer) - 1 if buffer_full else len(self.buffer)
+
+		return True
+
+	def _apply_key(self, key):
+		''' Applies the editing or cursor movement key to the input text. Returns True
+		if the text was modified.
+		'''
+		handler = self._key_handlers.get(key)
+		return handler() if handler else False
+
+	def _on_backspace(self):
+		''' Removes the character before the cursor.
+		'''
+		# Cursor moves back by the removed character
+		if self.cursor_position > 0: self.cursor_blit_position -= self._advance(self.text[self.cursor_position - 1])
+		self.text = (
+			self.text[:max(self.cursor_position - 1, 0)]
+			+ self.text[self.cursor_position:]
+		)
+		# Subtract one from cursor_pos, but do not go below zero:
+		self.cursor_position = max(self.cursor_position - 1, 0)
+		return True
+
+	def _on_delete(self):
+		''' Removes the character at the cursor.
+		'''
+		self.text = (
+			self.text[:self.cursor_position]
+			+ self.text[self.cursor_position + 1:]
+		)
+		return True
+
+	def _on_right(self):
+		''' Moves the cursor one character to the right.
+		'''
+		# Add one to cursor_pos, but do not exceed len(input_string)
+		if self.cursor_position < len(self.text):
+			self.cursor_blit_position += self._advance(self.text[self.cursor_position])
+			self.cursor_position += 1
+		return False
+
+	def _on_left(self):
+		''' Moves the cursor one character to the left.
+		'''
+		# Subtract one from cursor_pos, but do not go below zero:
+		if self.cursor_position > 0:
+			self.cursor_position -= 1
+			self.cursor_blit_position -= self._advance(self.text[self.cursor_position])
+		return False
+
+	def _on_end(self):
+		''' Moves the cursor to the end of the text.
+		'''
+		self.cursor_position = len(self.text)
+		self.cursor_blit_position = self._prompt_width + self._advance(self.text)
+		return False
+
+	def _on_home(self):
+		''' Moves the cursor to the beginning of the text.
+		'''
+		self.cursor_position = 0
+		self.cursor_blit_position = self._prompt_width
+		return False
+
+	def _on_up(self):
+		''' Scrolls the input history back - to the history.
+		'''
+		# Only scroll if there is something in the buffer
+		if len(self.buffer) > 0:
+			# Calc new buffer position
+			if self.buffer_offset >= 1: self.buffer_offset = self.buffer_offset - 1
+			if len(self.buffer) == self.buffer_offset: self.buffer_offset = self.buffer_offset + 1 # fix
+			#print(f"{self.buffer_offset=}, {len(self.buffer)=}")
+			# Restore previous input string - last in buffer
+			self.text = self.buffer[self.buffer_offset]						
+			# Set cursor possition at the end of the string
+			self.cursor_position = len(self.text)
+			self.cursor_blit_position = self._prompt_width + self._advance(self.text)
+			return True
+		return False
+
+	def _on_down(self):
+		''' Scrolls the input history forward - to the future.
+		'''
+		# Calc new buffer position
+		if self.buffer_offset < len(self.buffer) - 1:
+			self.buffer_offset = self.buffer_offset + 1
+			# Restore previous input string - last in buffer
+			self.text = self.buffer[self.buffer_offset]
+			# Set cursor possition at the end of the string
+			self.cursor_position = len(self.text)
+			self.cursor_blit_position = self._prompt_width + self._advance(self.text)
+			return True
+		return False
+
 	def show(self, surf, pos=(0,0)):
 		''' Blits main surface, text cut surface, text line and cursor to
-		the given surface.
+		the given surface. Nothing is done if the input is outside of the clipping area of surf.
 		'''
+		surf.blits(self._collect_blits(pos, surf.get_clip()), False)
+
+	def _collect_blits(self, origin, clip):
+		''' Prepares the input surfaces and returns the sequence of (surface, position) pairs
+		to be blitted for the input placed at origin. The sequence is empty if the input
+		is outside of the clip rect.
+		'''
+
+		# Nothing to show if the input would not be visible at all
+		if not self.surf_dim.move(origin).colliderect(clip): return []
+
+		# Compose the text surfaces again only if the text or the cursor position changed
+		if self._composed_state != (self.fnt_txt_surf, self.cursor_blit_position): self._compose()
+
+		# Background surface and the cutted text on it - with or without the cursor based on the blinking
+		return [(self.surf, (int(origin[0]), int(origin[1]))),
+				(self.txt_cursor_surf if self.cursor_visible else self.txt_surf,
+					(int(origin[0] + self.padding.left), int(origin[1] + self.padding.up)))]
+
+	def _compose(self):
+		''' Blits the input text (with its background) to txt_surf and composes its copy with
+		the cursor to txt_cursor_surf. The cursor blinking then only switches between the two.
+		'''
+		self._composed_state = (self.fnt_txt_surf, self.cursor_blit_position)
+		self._version += 1
 
-		# Background surface blit
-		surf.blit(self.surf, (int(pos[0]), int(pos[1])))
-		
 		# Clear the main text input surf on which the actual text is blitted
 		self.txt_surf.fill((0,0,0,0)) # Last 0 indicates alpha, i.e. full transparency
 
-		# Input text background blit
-		if self.font_bck_color:			
-			self.txt_surf.blit(self.fnt_bck_surf,
+		# Input text background and input text are blitted in one call
+		blits = []
+
+		# Input text background
+		if self.font_bck_color:
+			blits.append((self.fnt_bck_surf,
 					(int(self.fnt_txt_scroll_offset),
-					int(self.line_spacing - ((self.line_spacing - self.fnt_bck_surf_dim.height) // 2) - self.fnt_bck_surf_dim.height)))
+					int(self.line_spacing - ((self.line_spacing - self.fnt_bck_surf_dim.height) // 2) - self.fnt_bck_surf_dim.height)),
+					(0, 0, self.fnt_bck_surf_dim.width, self.line_spacing)))
 
-		# Input text blit
-		self.txt_surf.blit(self.fnt_txt_surf,
+		# Input text
+		blits.append((self.fnt_txt_surf,
 						(int(self.fnt_txt_scroll_offset),
-						int(self.line_spacing - ((self.line_spacing - self.fnt_txt_surf_dim.height) // 2) - self.fnt_txt_surf_dim.height)))
+						int(self.line_spacing - ((self.line_spacing - self.fnt_txt_surf_dim.height) // 2) - self.fnt_txt_surf_dim.height))))
+
+		self.txt_surf.blits(blits, False)
 
-		# Cursor blit
-		if self.cursor_visible:
-			self.txt_surf.blit(self.cursor_surf, 
+		# Cursor
+		self.txt_cursor_surf = self.txt_surf.copy()
+		self.txt_cursor_surf.blit(self.cursor_surf,
 						(int(self.fnt_txt_scroll_offset + self.cursor_blit_position),
 						int(self.line_spacing - ((self.line_spacing - self.cursor_surf_dim.height) // 2) - self.cursor_surf_dim.height)))
 
-		# Cutted text blit
-		surf.blit(self.txt_surf, 
-				(int(pos[0] + self.padding.left),
-				int(pos[1] + self.padding.up)))
-
 	def get_height(self):
 		''' Returns current height of the text input surface. 
 		Called from Console instance in order to construct all elements 
@@ -1241,6 +1740,20 @@ class TextInput:
 		'''		
 		return self.surf_dim.height
 
+	def _advance(self, text):
+		''' Returns the horizontal advance of the text in pixels, i.e. the distance
+		the cursor moves by writing the text. Advances of the characters are cached.
+		'''
+		adv_cache = self._adv_cache
+		advance = 0
+		for char in text:
+			char_advance = adv_cache.get(char)
+			if char_advance is None:
+				metrics = self.font_object.get_metrics(char)[0]
+				char_advance = adv_cache[char] = metrics[4] if metrics else 0
+			advance += char_advance
+		return advance
+
 	def get_text(self):
 		''' Method that reads the text and passs it to the console
 		'''
@@ -1252,7 +1765,7 @@ class TextInput:
 		'''
 		self.text = ''
 		self.cursor_position = 0		
-		self.cursor_blit_position = self.font_object.get_rect(self.prompt + self.text[:self.cursor_position]).width
+		self.cursor_blit_position = self._prompt_width
 		self.prepare_surface()
 
 class Console(pygame.Surface):
@@ -1267,6 +1780,9 @@ class Console(pygame.Surface):
 	# List of available animations for the console. If error, TOP is used as default.
 	ANIMATIONS = ['TOP', 'BOTTOM']
 
+	# Fully shown console - animation progress is kept as percentage in 16.16 fixed-point integer
+	_ANIM_FULL = 100 << 16
+
 
 	def __init__(self, app, width, config={}):
 		'''
@@ -1280,7 +1796,7 @@ class Console(pygame.Surface):
 				layout (optional, default 'INPUT_BOTTOM') : Determines the layout of header, footer, input and output part.
 				padding (optional, default (0,0,0,0)): Specifies padding around the console window and console items. The padding order is UP, DOWN, LEFT, RIGHT
 				bck_color (optional, default (0,0,0)): Color of the console background as tuple with 3 values.  Eg. (255,255,255) for white.
-				bck_image (optional, default None): Path to image displayed as the console background.
+				bck_image (optional, default None): Path to image displayed as the console background. It is converted to the display pixel format.
 				bck_image_resize (optional, default True): True/False, if image should be adjusted to the console dimensions.
 				bck_alpha (optional, default 255): 0-255, Transparency of console background.
 				welcome_msg (optional, default ''): Text displayed on console after console init.
@@ -1302,6 +1818,9 @@ class Console(pygame.Surface):
 		# By default console is disabled
 		self.enabled = False
 
+		# Area of the surface covered by the console during the last show call, None if not displayed
+		self.rect = None
+
 	def init(self, width: int, config: dict={}, app=None):
 		''' Can be called when the configuration is changed.
 
@@ -1315,7 +1834,7 @@ class Console(pygame.Surface):
 				layout (optional, default 'INPUT_BOTTOM') : Determines the layout of header, footer, input and output part.
 				padding (optional, default (0,0,0,0)): Specifies padding around the console window and console items. The padding order is UP, DOWN, LEFT, RIGHT
 				bck_color (optional, default (0,0,0)): Color of the console background as tuple with 3 values.  Eg. (255,255,255) for white.
-				bck_image (optional, default None): Path to image displayed as the console background.
+				bck_image (optional, default None): Path to image displayed as the console background. It is converted to the display pixel format.
 				bck_image_resize (optional, default True): True/False, if image should be adjusted to the console dimensions.
 				bck_alpha (optional, default 255): 0-255, Transparency of console background.
 				welcome_msg (optional, default ''): Text displayed on console after console init.
@@ -1363,7 +1882,7 @@ class Console(pygame.Surface):
 			buffer_bckp = self.console_input.buffer
 			buffer_offset_bckp = self.console_input.buffer_offset
 			self.console_input = TextInput(self, (width - self.padding.left - self.padding.right), config.get('input')) if config.get('input', None) else None
-			self.console_input.buffer = buffer_bckp
+			self.console_input.buffer = deque(buffer_bckp, maxlen=self.console_input.buffer_size)
 			self.console_input.buffer_offset = buffer_offset_bckp
 		except AttributeError: # console_input not yet initiated
 			self.console_input = TextInput(self, (width - self.padding.left - self.padding.right), config.get('input')) if config.get('input', None) else None
@@ -1373,8 +1892,7 @@ class Console(pygame.Surface):
 			buffer_bckp = self.console_output.buffer
 			buffer_offset_bckp = self.console_output.buffer_offset
 			self.console_output = TextOutput(self, (width - self.padding.left - self.padding.right), config.get('output')) if config.get('output', None) else None
-			self.console_output.buffer = buffer_bckp
-			self.console_output.buffer_offset = buffer_offset_bckp
+			self.console_output.set_buffer(buffer_bckp, buffer_offset_bckp)
 		except AttributeError: # console_input not yet initiated
 			self.console_output = TextOutput(self, (width - self.padding.left - self.padding.right), config.get('output')) if config.get('output', None) else None
 
@@ -1401,26 +1919,47 @@ class Console(pygame.Surface):
 
 		# Prepare console background image
 		if self.bck_image:
-			self.bck_image = pygame.image.load(str(self.bck_image)).convert()
+			self.bck_image = _convert_surface(pygame.image.load(str(self.bck_image)))
 			if self.bck_image_resize:
 				self.bck_image = pygame.transform.scale(self.bck_image, (self.dim))
 
+		# Paint the console background once - the components are blitted directly to the target
+		# surface, so nothing else is ever drawn on the console surface and it does not change
+		self.fill(self.bck_color)
+
+		# If background image is defined, paste it to console surface
+		if self.bck_image: self.blit(self.bck_image, (0, 0))
+
 		# Set Console transparency
 		self.set_alpha(self.bck_alpha)
 
+		# Opaque console - the background with the components is composed to the frame cache, which is
+		# blitted to the target surface alone as long as the components do not change. Not possible
+		# with transparent background as the game screen below the console changes every frame.
+		self._frame_cache = self.copy() if self.bck_alpha >= 255 else None
+		self._frame_key = None # components blits and versions the frame cache was composed for
+
+		# Initiate variable for storing percentage of shown console surface (0 nothing shown, 100 all shown)
+		self.anim_perc = 0
+		self._anim_q = 0 # the same in fixed-point (see _ANIM_FULL) - used for the animation
+
+		# Layout state the positions of the components were calculated for (see _layout_state) - None forces the calculation
+		self._layout_key = None
+
 		''' Animation part - Prepare variables managing animation, if animation is enabled 
 		'''
 		if self.animation:
 			# If specified animation layout is not found, 'TOP' layout will be used as default
 			self.anim_layout = self.animation[0] if len(self.animation) > 0 and self.animation[0] in Console.ANIMATIONS else 'TOP'
+			# Animation layout resolved once to a flag tested in show instead of comparing the name every frame
+			self._anim_from_bottom = self.anim_layout == 'BOTTOM'
 			# If animation time is not specified use 100 ms
 			self.anim_time = self.animation[1] if len(self.animation) > 1 else 100
-			# Calculate animation velocity based on the console dimensions (height)
+			# Calculate animation velocity based on the console dimensions (height) - fixed-point percentage per ms
 			self.anim_velocity = self.dim[1] / self.anim_time
+			self._anim_velocity_q = int(self.anim_velocity * 65536)
 			# Initiate variable for remembering the time
 			self.anim_last_time = 0
-			# Initiate variable for storing percentage of shown console surface (0 nothing shown, 100 all shown)
-			self.anim_perc = 0
 
 	def set_cli_app(self, module: str):
 		'''Sets the module/class/function to be used as reference entry point to the game.
@@ -1434,59 +1973,61 @@ class Console(pygame.Surface):
 
 
 		# Get and translate the package-method pairs from text_params parameter
-		try:
-			tmp_text_params = []
-			for pack_method in self.console_header.text_params: # iterate list of pack-method values
-				package, method = pack_method
-				package = self.app if package is None else package # if package is not specified use the console CLI app
-				tmp_text_params.append([package, method])
-			self.console_header.text_params = tmp_text_params
-		except AttributeError:
-			# if self.text_params are not defined, continue
-			pass
+		self._resolve_text_params(self.console_header)
+		self._resolve_text_params(self.console_footer)
 
-		# Get and translate the package-method pairs from text_params parameter
+	def _resolve_text_params(self, component):
+		''' Translate the package-method pairs from text_params of the given header/footer
+		(package None means the console CLI app) and bind them for updating the text.
+		'''
 		try:
-			tmp_text_params = []
-			for pack_method in self.console_footer.text_params: # iterate list of pack-method values
-				package, method = pack_method
-				package = self.app if package is None else package # if package is not specified use the console CLI app
-				tmp_text_params.append([package, method])
-			self.console_footer.text_params = tmp_text_params
+			component.text_params = tuple((self.app if package is None else package, method) for package, method in component.text_params)
+			component.bind_text_params()
 		except AttributeError:
-			# if self.text_params are not defined, continue
+			# if component or its text_params are not defined, continue
 			pass
 
-	def update(self, events):
+	def update(self, events, now=None):
 		''' Call updates of relevant console parts. If ENTER was pressed, process the command.
 		Only process if console is enabled.
+
+		Optional now is the time of the frame in ms (pygame.time.get_ticks()). The game can pass
+		the value it uses for the frame, so that the console timing is consistent with the game.
 		'''
 		
 		# Do update only if the console is active/enabled
 		if self.enabled:
 
+			# Components used several times - looked up once
+			console_input = self.console_input
+
 			# If console has defined input and enter is pressed (entering command into the console)
-			if self.console_input and self.console_input.update(events):
+			if console_input and console_input.update(events, now):
 				
 				# Put it into the textoutput - if output is defined
-				if self.console_output: self.console_output.write(self.console_input.get_text(), self.console_input.font_color)
+				if self.console_output: self.console_output.write(console_input.get_text(), console_input.font_color)
 
 				# Process the entered line by CLI instance
-				self.cli.onecmd(self.console_input.get_text())
+				self.cli.onecmd(console_input.get_text())
 				
 				# Reset the text, so that new one can be entered
 				self.console_input.clear_text()
 
+			# Looked up only after the command was processed - the command can re-init the console
+			console_output = self.console_output
+			console_header = self.console_header
+			console_footer = self.console_footer
+
 			# Check if text output keys for scrolling the buffer were used
-			if self.console_output: self.console_output.update(events)
+			if console_output: console_output.update(events)
 
 			# Update the header - in order to update the dynamic values shown in the header
-			if self.console_header: self.console_header.update()
+			if console_header and not console_header.is_static: console_header.update()
 
 			# Update the footer - in order to update the dynamic values shown in the footer
-			if self.console_footer: self.console_footer.update()
+			if console_footer and not console_footer.is_static: console_footer.update()
 
-	def show(self, surf, pos=None, disable_anim=None):
+	def show(self, surf, pos=None, disable_anim=None, now=None):
 		''' Manages bliting of console (background, textoutput, textinput)
 		to the given surf surface and on given pos position. Also manages displaying
 		of proper animation, if enabled by configuration.
@@ -1496,29 +2037,46 @@ class Console(pygame.Surface):
 		origin where the fully displayed console is placed.
 
 		If parameter disable_anim is set to True, animation is forcefully disabled.
+
+		Optional now is the time of the frame in ms (pygame.time.get_ticks()) used for the animation.
+		The game can pass the value it uses for the frame, it is read if not given.
+
+		After the call, self.rect holds the area of surf covered by the console (None if
+		the console is hidden). It can be used for updating only the changed parts of the display.
 		'''
 
+		# Attributes used several times - looked up once
+		enabled = self.enabled
+		anim_q = self._anim_q
+		anim_full = self._ANIM_FULL
+
+		# Nothing to do if the console is hidden and the hiding animation is finished
+		if not enabled and anim_q <= 0:
+			self.rect = None
+			return
+
 		#####
 		# Calculate the delta parameters for displaying animated console
 		#####		
 
+		# The console moves only on Y axis, hence no need to adjust X axis in any case
+		anim_dx = 0
+
 		# No animation required - no delta from original position. Console is either fully shown or fully hidden.
 		if not self.animation or disable_anim:
 			
 			# In no position is entered go for upper left corner
-			pos = (0,0) if not pos else pos
+			if not pos: pos = (0,0)
 
-			anim_dx = 0		
 			anim_dy = 0
 
-			if self.enabled: self.anim_perc = 100
-			else: self.anim_perc = 0
+			anim_q = anim_full if enabled else 0
 
 		# Animation required - based on animation parameters calculate the portion of the console to be displayed
 		# expressed by delta parameters anim_dx and anim_dy.
 		else:
 	
-			current_time = pygame.time.get_ticks()
+			current_time = pygame.time.get_ticks() if now is None else now
 
 			#####
 			# Update percentage of animation shown and the time
@@ -1526,110 +2084,137 @@ class Console(pygame.Surface):
 
 			# If console is enabled, I need to continue animation or show full console if animation is finished or no animation is requested.
 			# If console is disabled, I need to continue hiding animation or fully hide the console if animation is finished
-			if (self.enabled and self.anim_perc < 100) or (not self.enabled and self.anim_perc > 0):
-				self.anim_perc = self.anim_perc + (1 if self.enabled else -1) * (current_time - self.anim_last_time) * self.anim_velocity 
+			# The progress is computed in integers only - ticks are integer ms and the velocity is fixed-point
+			if (enabled and anim_q < anim_full) or (not enabled and anim_q > 0):
+				anim_q = anim_q + (1 if enabled else -1) * (current_time - self.anim_last_time) * self._anim_velocity_q 
 				self.anim_last_time = current_time 
 
 			# Do correction in case that console is fully displayed or fully hidden
-			self.anim_perc = 100 if self.anim_perc > 100 else self.anim_perc
-			self.anim_perc = 0 if self.anim_perc < 0 else self.anim_perc
+			anim_q = min(anim_full, max(0, anim_q))
 
 			#####
 			# Prepare the coordinates for animation based on animation layout
 			#####
 
 			# Pos parameter that is passed to show function should refer to the top edge of the surface
-			if self.anim_layout == 'TOP':
+			if not self._anim_from_bottom:
 				# For the best results TOP animation should happen from the upper edge of the screen  (surface)
-				pos = (0,0) if not pos else pos
-				# Movement is only on Y axis, hence no need to adjust X axis
-				anim_dx = 0
+				if not pos: pos = (0,0)
 				# Correction of Y coordinate base on percentage of console that we need to display
-				anim_dy =  -self.dim[1] * (1 - self.anim_perc / 100)
+				anim_dy =  -(self.dim[1] * (anim_full - anim_q) // anim_full)
 
 			# Pos parameter that is passed to the show function should refer to the bottom edge of the surface
-			if self.anim_layout == 'BOTTOM':
+			else:
 				# For the best results TOP animation should happen from the bottom edge of the screen (surface)
-				pos = (0,surf.get_height()) if not pos else pos
-				# Movement is only on Y axis, hence no need to adjust X axis
-				anim_dx = 0
+				if not pos: pos = (0,surf.get_height())
 				# Correction of Y coordinate base on percentage of console that we need to display
-				anim_dy =  -self.dim[1] * (1 - (100 - self.anim_perc) / 100)
+				anim_dy =  -(self.dim[1] * anim_q // anim_full)
 
+		# Percentage is rounded up - it is 0 only if the console is completely hidden
+		self._anim_q = anim_q
+		self.anim_perc = -(-anim_q >> 16)
 
 		#####
 		# Display the console to the surface, if needed - anim_perc > 0
 		#####		
 
+		# Nothing is displayed unless the code below says otherwise
+		self.rect = None
+
 		# This happens when console is either enabled or disabled and is being hidden
-		if self.anim_perc > 0:
+		if anim_q > 0:
 
 			#####
 			# Prepare the individual console components coordinates based on the layout. More layouts can be added here.
 			#####
 
 			# Calculate position of layout items on the console based on the layout	must be done here as the console output height is changing
-			# based on lines displayed on the output.
-			if self.layout == 'INPUT_BOTTOM':
-				self.header_position = (self.padding.left, self.padding.up)
-				self.text_output_position = (self.padding.left, self.header_position[1] + (self.console_header.get_height() if self.console_header else 0))
-				self.text_input_position = (self.padding.left, self.text_output_position[1] + (self.console_output.get_height() if self.console_output else 0))
-				self.footer_position = (self.padding.left, self.dim[1] - self.padding.down - (self.console_footer.get_height() if self.console_footer else 0))		
-
-			if self.layout == 'INPUT_TOP':
-				self.header_position = (self.padding.left, self.padding.up)
-				self.text_input_position = (self.padding.left, self.header_position[1] + (self.console_header.get_height() if self.console_header else 0))
-				self.text_output_position = (self.padding.left, self.text_input_position[1] + (self.console_input.get_height() if self.console_input else 0))
-				self.footer_position = (self.padding.left, self.dim[1] - self.padding.down - (self.console_footer.get_height() if self.console_footer else 0))		
+			# based on lines displayed on the output and paddings or components can be changed by console commands. The positions
+			# are only calculated again when any of those changed since the last time.
+			layout_key = self._layout_state()
+			if layout_key != self._layout_key:
+				self._layout_key = layout_key
+				self._layout_components()
 
 			#####
 			# Blit everything with the corrections
 			#####
 
-			# Clear Console background surface		
-			self.fill(self.bck_color)
+			# Console background followed by the surfaces of all the components, so that all of them are
+			# blitted to the surface in one call. Collecting the surfaces of the components instead of
+			# blitting them directly enables transparent backgrounds and non transparent text displayed on them.
+			# Input and output are placed either on top or at the bottom of the console based on the layout.
+			origin_x = int(pos[0] + anim_dx)
+			origin_y = int(pos[1] + anim_dy)
+			clip = surf.get_clip()
+			components = self._components
 
-			# If background image is defined, paste it to console surface
-			if self.bck_image: self.blit(self.bck_image, (0, 0))
+			# Transparent console - blitted directly to the surface
+			if self._frame_cache is None:
 
-			# Blit console background to the surface
-			surf.blit(self, (int(pos[0] + anim_dx), int(pos[1] + anim_dy)))
+				blit_seq = [(self, (origin_x, origin_y))]
 
-			# Blit header onto the surface - by calling show and not blitting directly enables
-			# transparent background and non transparent text displayed on it.
-			if self.console_header:
-				self.console_header.show(
-					surf,
-					(int(pos[0] + anim_dx + self.header_position[0]),
-					int(pos[1] + anim_dy + self.header_position[1]))
-					)
+				for (component, position) in components:
 
-			# Blit output onto the surface
-			# Based on parameter text_input_position either on top or at the bottom of the console
-			if self.console_output:
-				self.console_output.show(
-					surf,
-					(int(pos[0] + anim_dx + self.text_output_position[0]),
-					int(pos[1] + anim_dy + self.text_output_position[1]))
-					)
-			
-			# Blit input surface onto the surface
-			# Based on parameter text_input_position either on top or at the bottom of the console
-			if self.console_input:
-				self.console_input.show(
-					surf,
-					(int(pos[0] + anim_dx + self.text_input_position[0]),
-					int(pos[1] + anim_dy + self.text_input_position[1]))
-					)		
-
-			# Blit footer onto the surface
-			if self.console_footer:
-				self.console_footer.show(
-					surf,
-					(int(pos[0] + anim_dx + self.footer_position[0]),
-					int(pos[1] + anim_dy + self.footer_position[1]))
-					)
+					# Positions are whole pixels - the components are placed relative to the rounded console origin
+					blit_seq += component._collect_blits((origin_x + position[0], origin_y + position[1]), clip)
+
+				# No rects are returned by the blits
+				surf.blits(blit_seq, False)
+
+			# Opaque console - the components are collected relative to the console and composed to the
+			# frame cache only if they changed since the last frame. The animation only moves the cache.
+			else:
+
+				local_clip = clip.move(-origin_x, -origin_y)
+				blit_seq = []
+
+				for (component, position) in components:
+					blit_seq += component._collect_blits(position, local_clip)
+
+				# The surfaces and positions to blit and the versions of the redrawn surfaces on them
+				frame_key = (blit_seq, tuple(component._version for (component, position) in components))
+				if frame_key != self._frame_key:
+					self._frame_key = frame_key
+					self._frame_cache.blit(self, (0, 0))
+					self._frame_cache.blits(blit_seq, False)
+
+				surf.blit(self._frame_cache, (origin_x, origin_y))
+
+			# The area covered by the console is the one of its background clipped the same way as by the blit
+			self.rect = self.get_rect(topleft=(origin_x, origin_y)).clip(clip)
 	
+	def _layout_state(self):
+		''' Returns all the values the positions of the components depend on - the layout, paddings,
+		console height and the components with their heights.
+		'''
+		padding = self.padding
+		return (self.layout, padding.up, padding.down, padding.left, self.dim[1],
+				tuple((component, component.get_height() if component else 0) for component in
+					(self.console_header, self.console_output, self.console_input, self.console_footer)))
+
+	def _layout_components(self):
+		''' Calculates positions of the console components on the console based on the layout.
+		'''
+		if self.layout == 'INPUT_BOTTOM':
+			self.header_position = (self.padding.left, self.padding.up)
+			self.text_output_position = (self.padding.left, self.header_position[1] + (self.console_header.get_height() if self.console_header else 0))
+			self.text_input_position = (self.padding.left, self.text_output_position[1] + (self.console_output.get_height() if self.console_output else 0))
+			self.footer_position = (self.padding.left, self.dim[1] - self.padding.down - (self.console_footer.get_height() if self.console_footer else 0))		
+
+		elif self.layout == 'INPUT_TOP':
+			self.header_position = (self.padding.left, self.padding.up)
+			self.text_input_position = (self.padding.left, self.header_position[1] + (self.console_header.get_height() if self.console_header else 0))
+			self.text_output_position = (self.padding.left, self.text_input_position[1] + (self.console_input.get_height() if self.console_input else 0))
+			self.footer_position = (self.padding.left, self.dim[1] - self.padding.down - (self.console_footer.get_height() if self.console_footer else 0))		
+
+		# Existing components with their positions in the order of blitting - iterated by show every frame
+		self._components = tuple((component, position) for (component, position) in (
+				(self.console_header, self.header_position),
+				(self.console_output, self.text_output_position),
+				(self.console_input, self.text_input_position),
+				(self.console_footer, self.footer_position)) if component)
+
 	def write(self, text, color=None):
 		''' Put some text onto a console by calling this function
 		'''
@@ -1638,6 +2223,13 @@ class Console(pygame.Surface):
 		# Without calling prepare_surface the text will not be shown immediatelly
 		self.console_output.prepare_surface()
 
+	@property
+	def is_active(self) -> bool:
+		''' True if the console is enabled or it is still being hidden by the animation.
+		If False, calling update and show functions can be skipped as they have nothing to do.
+		'''
+		return self.enabled or self.anim_perc > 0
+
 	def toggle(self, enable=None) -> bool:
 		''' Toggle on/off the console. Influences if updade and show console functions are 
 		working.
@@ -1665,5 +2257,5 @@ class Console(pygame.Surface):
 	def clear(self):
 		''' Method that clears the output on the screen
 		'''
-		self.console_output.log = list()
+		self.console_output.clear()
 		self.console_output.prepare_surface()